@@ -1,7 +1,16 @@
 #!user/bin/python
 # -*- coding: utf-8 -*-
+import hashlib
+import io
 import os, sys
+import pickle
+import re
 import traceback
+from collections import defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
+from typing import Optional, Union
 
 from SCons.Variables import BoolVariable
 
@@ -16,11 +25,25 @@ sdk_include_dir = "thirdparty/eos-sdk/SDK/Include"
 gen_dir = "gd_eos/gen/"
 gen_include_dir = os.path.join(gen_dir, "include")
 gen_src_dir = os.path.join(gen_dir, "src")
+parse_cache_dir = os.path.join(gen_dir, ".parse_cache")
 
 # 解析结果
 struct2additional_method_requirements: dict[str, dict[str, bool]] = {}  # dict[str, dict[str, bool]]
 expanded_as_args_structs: list[str] = []  # 需要被展开为参数形式的结构体
 
+# 结构体用途索引，由 _index_struct_roles() 构建
+# 结构体 -> 是否仅被未处理的方法/回调使用（需要警告）
+arg_out_structs: dict[str, bool] = {}
+input_structs: dict[str, bool] = {}
+output_structs: dict[str, bool] = {}
+# 结构体 -> 以字段持有该结构体的结构体（以 dict 作为有序集合去重）
+struct2internal_owners: dict[str, dict[str, None]] = {}
+struct2internal_arr_owners: dict[str, dict[str, None]] = {}
+# 枚举 -> 所属句柄类名，由 _index_enum_owners() 构建（None 表示不受支持的非句柄枚举）
+enum2owner_class: dict[str, Optional[str]] = {}
+# 回调 -> 以该回调类型为参数的方法（按遍历顺序，同一方法可重复出现），由 _index_callback_methods() 构建
+callback2methods: dict[str, list[str]] = {}
+
 interfaces: dict[str, dict] = {
     "Platform": {
         "EOS_Platform_Create": {
@@ -48,7 +71,7 @@ handles: dict[str, dict] = {
 }
 
 
-api_latest_macros: list[str] = []
+api_latest_macros: set[str] = set()
 release_methods: dict[str, dict] = {}
 
 unhandled_methods: dict[str, dict] = {}
@@ -58,6 +81,7 @@ unhandled_constants: dict[str, list[str]] = {}
 unhandled_infos: dict[str, dict] = {}
 
 generate_infos: dict = {}
+sdk_header_files: set[str] = set()  # SDK 头文件目录下的文件名，解析时列出一次供生成时查询
 
 # generate options
 # 是否将Options结构展开为输入参数的，除了 ApiVersion 以外的最大字段数量,减少需要注册的类，以减少编译后大小
@@ -131,18 +155,8 @@ def generate_bindings(
 
     # make dir
     for base_dir in [gen_include_dir, gen_src_dir]:
-        if not os.path.exists(base_dir):
-            os.makedirs(base_dir)
-        if not os.path.exists(os.path.join(base_dir, "enums")):
-            os.makedirs(os.path.join(base_dir, "enums"))
-        if not os.path.exists(os.path.join(base_dir, "structs")):
-            os.makedirs(os.path.join(base_dir, "structs"))
-        if not os.path.exists(os.path.join(base_dir, "packed_results")):
-            os.makedirs(os.path.join(base_dir, "packed_results"))
-        if not os.path.exists(os.path.join(base_dir, "handles")):
-            os.makedirs(os.path.join(base_dir, "handles"))
-        if not os.path.exists(os.path.join(base_dir, "interfaces")):
-            os.makedirs(os.path.join(base_dir, "interfaces"))
+        for sub_dir in ["enums", "structs", "packed_results", "handles", "interfaces"]:
+            os.makedirs(os.path.join(base_dir, sub_dir), exist_ok=True)
     # 解析文件
     print("Parsing...")
     parse_all_file()
@@ -162,26 +176,22 @@ def generate_bindings(
 # 在编译前调用
 def preprocess():
     eos_base_file = os.path.join(sdk_include_dir, "eos_base.h")
-    f = open(eos_base_file, "r")
-
-    # 备份 eos_base.h
-    bck = open("./.eos_base.h.bak", "w")
-    bck.write(f.read())
-    bck.close()
+    with open(eos_base_file, "r") as f:
+        # 备份 eos_base.h
+        with open("./.eos_base.h.bak", "w") as bck:
+            bck.write(f.read())
 
-    # 除去 eos_base.h 中的 #define EOS_HAS_ENUM_CLASS, 影响枚举的绑定
-    f.seek(0)
-    lines: list[str] = f.readlines()
-    f.close()
+        # 除去 eos_base.h 中的 #define EOS_HAS_ENUM_CLASS, 影响枚举的绑定
+        f.seek(0)
+        lines: list[str] = f.readlines()
 
     for i in range(len(lines)):
         line = lines[i]
         if "#define EOS_HAS_ENUM_CLASS" in line and not line.startswith("//"):
             lines[i] = "//" + line
 
-    f = open(eos_base_file, "w")
-    f.write("".join(lines))
-    f.close()
+    with open(eos_base_file, "w") as f:
+        f.write("".join(lines))
 
 
 # 在编译后调用
@@ -309,22 +319,32 @@ def gen_all_in_one():
     handle_types.insert(0, "EOS_HAntiCheatCommon")
     handle_types.insert(0, "EOS")
 
-    for handle_type in handle_types:
-        handle_class: str = _convert_handle_class_name(handle_type)
-        register_classes_lines.append(f"\tEOS_REGISTER_{handle_class}\\")
+    handle_classes: list[str] = [_convert_handle_class_name(handle_type) for handle_type in handle_types]
+    # 特殊基类没有单例
+    singleton_classes: list[str] = [_convert_handle_class_name(handle_type) for handle_type in handle_types if not handle_type in ["EOS", "EOS_HAntiCheatCommon"]]
+    platform_class = _convert_handle_class_name("EOS_HPlatform")
 
-        if handle_type in ["EOS", "EOS_HAntiCheatCommon"]:
-            continue  # 特殊基类没有单例
-        register_singleton_lines.append(
-            f"\tgodot::Engine::get_singleton()->register_singleton(godot::eos::{handle_class}::get_class_static(), godot::eos::{handle_class}::get_singleton());\\"
-        )
-        if handle_type == "EOS_HPlatform":
+    register_classes_lines.extend(f"\tEOS_REGISTER_{handle_class}\\" for handle_class in handle_classes)
+    register_singleton_lines.extend(
+        f"\tgodot::Engine::get_singleton()->register_singleton(godot::eos::{handle_class}::get_class_static(), godot::eos::{handle_class}::get_singleton());\\"
+        for handle_class in singleton_classes
+    )
+    for handle_class in singleton_classes:
+        if handle_class == platform_class:
             continue  # Platform 接口必须在最后析构
-        unregister_singleton_lines.append(f"\tgodot::Engine::get_singleton()->unregister_singleton(godot::eos::{handle_class}::get_class_static());\\")
-        unregister_singleton_lines.append(f"\tmemdelete(godot::eos::{handle_class}::get_singleton());\\")
+        unregister_singleton_lines.extend(
+            (
+                f"\tgodot::Engine::get_singleton()->unregister_singleton(godot::eos::{handle_class}::get_class_static());\\",
+                f"\tmemdelete(godot::eos::{handle_class}::get_singleton());\\",
+            )
+        )
 
-    unregister_singleton_lines.append(f"\tgodot::Engine::get_singleton()->unregister_singleton(godot::eos::{ _convert_handle_class_name('EOS_HPlatform')}::get_class_static());\\")
-    unregister_singleton_lines.append(f"\tmemdelete(godot::eos::{ _convert_handle_class_name('EOS_HPlatform')}::get_singleton());\\")
+    unregister_singleton_lines.extend(
+        (
+            f"\tgodot::Engine::get_singleton()->unregister_singleton(godot::eos::{platform_class}::get_class_static());\\",
+            f"\tmemdelete(godot::eos::{platform_class}::get_singleton());\\",
+        )
+    )
     __remove_backslash_of_last_line(register_classes_lines)
     __remove_backslash_of_last_line(register_singleton_lines)
     __remove_backslash_of_last_line(unregister_singleton_lines)
@@ -332,13 +352,9 @@ def gen_all_in_one():
     register_singleton_lines.append("")
     unregister_singleton_lines.append("")
 
-    register_classes_lines.append("")
-    register_classes_lines.append("} // namesapce godot")
-    register_classes_lines.append("")
+    register_classes_lines.extend(("", "} // namesapce godot", ""))
 
-    f = open(os.path.join(gen_include_dir, "eos_interfaces.h"), "w")
-    f.write("\n".join(lines + register_classes_lines + register_singleton_lines + unregister_singleton_lines))
-    f.close()
+    _write_lines(os.path.join(gen_include_dir, "eos_interfaces.h"), lines + register_classes_lines + register_singleton_lines + unregister_singleton_lines)
 
 
 def _gen_disabled_macro(handle_type: str) -> str:
@@ -350,9 +366,9 @@ def _gen_disabled_macro(handle_type: str) -> str:
 def gen_files(file_base_name: str, infos: dict):
     eos_header = file_base_name + ".h"
     eos_types_header = file_base_name + ".h"
-    if os.path.exists(os.path.join(sdk_include_dir, file_base_name + "_types.h")):
+    if file_base_name + "_types.h" in sdk_header_files:
         eos_types_header = file_base_name + "_types.h"
-    if not os.path.exists(os.path.join(sdk_include_dir, eos_header)):
+    if not eos_header in sdk_header_files:
         eos_header = eos_types_header
 
     if file_base_name == "eos_sdk":
@@ -416,16 +432,12 @@ def gen_files(file_base_name: str, infos: dict):
     packed_result_cpp_lines.append("} // namespace godot::eos")
     packed_result_cpp_lines.append("")
     if has_packed_result:
-        f = open(packed_result_h_file, "w")
-        f.write("\n".join(packed_result_h_lines))
-        f.close()
-        f = open(packed_result_cpp_file, "w")
-        f.write("\n".join(packed_result_cpp_lines))
-        f.close()
+        _write_lines(packed_result_h_file, packed_result_h_lines)
+        _write_lines(packed_result_cpp_file, packed_result_cpp_lines)
 
     # Handles Gen
     if len(sub_handles):
-        handles_cpp_lines: list[str] = [f'#include <handles/{file_base_name + ".handles.h"}>']
+        handles_cpp_lines: deque[str] = deque([f'#include <handles/{file_base_name + ".handles.h"}>'])
         handles_cpp_lines.append(f"#include <{file_base_name}.h>")
 
         # 供绑定使用
@@ -450,13 +462,9 @@ def gen_files(file_base_name: str, infos: dict):
         handles_hpp_lines: list[str] = gen_handles(interface_handle, additional_include_lines, sub_handles, handles_cpp_lines)
 
         if len(handles_hpp_lines):
-            f = open(handles_h_file, "w")
-            f.write("\n".join(handles_hpp_lines))
-            f.close()
+            _write_lines(handles_h_file, handles_hpp_lines)
 
-            f = open(handles_cpp_file, "w")
-            f.write("\n".join(handles_cpp_lines))
-            f.close()
+            _write_lines(handles_cpp_file, handles_cpp_lines)
 
     structs_to_gen: dict = {}
     for st in infos["structs"]:
@@ -494,14 +502,10 @@ def gen_files(file_base_name: str, infos: dict):
         )
 
         # Structs h file
-        f = open(structs_h_file, "w")
-        f.write("\n".join(structs_h_lines))
-        f.close()
+        _write_lines(structs_h_file, structs_h_lines)
 
         # Structs cpp file
-        f = open(structs_cpp_file, "w")
-        f.write("\n".join(structs_cpp_lines))
-        f.close()
+        _write_lines(structs_cpp_file, structs_cpp_lines)
 
     # 检查
     if len(infos["enums"]):
@@ -526,14 +530,12 @@ def gen_files(file_base_name: str, infos: dict):
             enums[e] = handle_enums[e]
     if len(enums):
         enums_inl: str = gen_enums(macro_suffix, interface_handle, enums)
-        f = open(enums_inline_file, "w")
-        f.write(enums_inl)
-        f.close()
+        _write_lines(enums_inline_file, [enums_inl])
 
     # 生成接口
     disabled_macro: str = _gen_disabled_macro(interface_handle)
     interface_handle_h_lines: list[str] = []
-    interface_handle_cpp_lines: list[str] = []
+    interface_handle_cpp_lines: deque[str] = deque()
     interface_handle_h_lines.append(f"#pragma once")
 
     if len(disabled_macro):
@@ -645,75 +647,62 @@ def gen_files(file_base_name: str, infos: dict):
         interface_handle_cpp_lines.append(f"#endif // {disabled_macro}")
         interface_handle_cpp_lines.append(f"")
 
-    f = open(interface_handle_h_file, "w")
-    f.write("\n".join(interface_handle_h_lines))
-    f.close()
+    _write_lines(interface_handle_h_file, interface_handle_h_lines)
 
-    f = open(interface_handle_cpp_file, "w")
-    f.write("\n".join(interface_handle_cpp_lines))
-    f.close()
+    _write_lines(interface_handle_cpp_file, interface_handle_cpp_lines)
 
 
 def gen_enums(macro_suffix: str, handle_class: str, enums: dict) -> str:
-    lines = ["#pragma once"]
-    lines.append("")
+    # 宏的每一行以 "\\\n" 开头续接上一行，因此最后一行无需移除行尾的反斜杠
+    buf = io.StringIO()
+    buf.write("#pragma once\n")
     converted_handle_class = _convert_handle_class_name(handle_class)
 
-    # Bind enum value macro
+    # 单次遍历，同时收集 _BIND_ENUMS/_USING_ENUMS/_CAST_ENUMS 宏的各行
+    bind_enums_lines: list[str] = []
+    using_enums_lines: list[str] = []
+    cast_enums_lines: list[str] = []
+
     for enum_type in enums:
         if _is_need_skip_enum_type(enum_type):
             continue
-        lines.append(f"#define _BIND_ENUM_{enum_type}()\\")
-        if _is_enum_flags_type(enum_type):
-            for e_info in enums[enum_type]["members"]:
-                e = e_info["name"]
-                if _is_need_skip_enum_value(enum_type, e):
-                    continue
-                lines.append(f'\t_BIND_ENUM_BITFIELD_FLAG({enum_type}, {e}, "{_convert_enum_value(e)}")\\')
-                # 文档
-                _insert_doc_constant(converted_handle_class, _convert_enum_value(e), e_info["doc"])
-        else:
-            for e_info in enums[enum_type]["members"]:
-                e = e_info["name"]
-                if _is_need_skip_enum_value(enum_type, e):
-                    continue
-                lines.append(f'\t_BIND_ENUM_CONSTANT({enum_type}, {e}, "{_convert_enum_value(e)}")\\')
-                # 文档
-                _insert_doc_constant(converted_handle_class, _convert_enum_value(e), e_info["doc"])
-        __remove_backslash_of_last_line(lines)
-        lines.append("")
+        is_flags: bool = _is_enum_flags_type(enum_type)
+        converted_enum_type: str = _convert_enum_type(enum_type)
+
+        # Bind enum value macro
+        buf.write(f"\n#define _BIND_ENUM_{enum_type}()")
+        bind_macro = "_BIND_ENUM_BITFIELD_FLAG" if is_flags else "_BIND_ENUM_CONSTANT"
+        for e_info in enums[enum_type]["members"]:
+            e = e_info["name"]
+            if _is_need_skip_enum_value(enum_type, e):
+                continue
+            converted_value = _convert_enum_value(e)
+            buf.write(f'\\\n\t{bind_macro}({enum_type}, {e}, "{converted_value}")')
+            # 文档
+            _insert_doc_constant(converted_handle_class, converted_value, e_info["doc"])
+        buf.write("\n")
+
+        bind_enums_lines.append(f"\\\n\t_BIND_ENUM_{enum_type}()")
+        using_enums_lines.append(f"\\\n\tusing {converted_enum_type} = {enum_type};")
+        cast_macro = "VARIANT_BITFIELD_CAST" if is_flags else "VARIANT_ENUM_CAST"
+        cast_enums_lines.append(f"\\\n\t{cast_macro}(godot::eos::{converted_handle_class}::{converted_enum_type})")
 
     # Bind macro
-    lines.append(f"#define _BIND_ENUMS_{macro_suffix}()\\")
-    for enum_type in enums:
-        if _is_need_skip_enum_type(enum_type):
-            continue
-        lines.append(f"\t_BIND_ENUM_{enum_type}()\\")
-    __remove_backslash_of_last_line(lines)
-    lines.append("")
+    buf.write(f"\n#define _BIND_ENUMS_{macro_suffix}()")
+    buf.write("".join(bind_enums_lines))
+    buf.write("\n")
 
     # Using macro
-    lines.append(f"#define _USING_ENUMS_{macro_suffix}()\\")
-    for enum_type in enums:
-        if _is_need_skip_enum_type(enum_type):
-            continue
-        lines.append(f"\tusing {_convert_enum_type(enum_type)} = {enum_type};\\")
-    __remove_backslash_of_last_line(lines)
-    lines.append("")
+    buf.write(f"\n#define _USING_ENUMS_{macro_suffix}()")
+    buf.write("".join(using_enums_lines))
+    buf.write("\n")
 
     # Variant cast macro
-    lines.append(f"#define _CAST_ENUMS_{macro_suffix}()\\")
-    for enum_type in enums:
-        if _is_need_skip_enum_type(enum_type):
-            continue
-        if _is_enum_flags_type(enum_type):
-            lines.append(f"\tVARIANT_BITFIELD_CAST(godot::eos::{converted_handle_class}::{_convert_enum_type(enum_type)})\\")
-        else:
-            lines.append(f"\tVARIANT_ENUM_CAST(godot::eos::{converted_handle_class}::{_convert_enum_type(enum_type)})\\")
-    __remove_backslash_of_last_line(lines)
-    lines.append("")
+    buf.write(f"\n#define _CAST_ENUMS_{macro_suffix}()")
+    buf.write("".join(cast_enums_lines))
+    buf.write("\n")
 
-    return "\n".join(lines)
+    return buf.getvalue()
 
 
 def gen_structs(
@@ -742,12 +731,10 @@ def gen_structs(
         lines += additional_include_lines
         lines.append("")
 
+    struct_types: list[str] = [struct_type for struct_type in struct_infos if not _is_expanded_struct(struct_type) and not _is_need_skip_struct(struct_type)]
+
     lines.append("namespace godot::eos {")
-    for struct_type in struct_infos:
-        if _is_expanded_struct(struct_type):
-            continue
-        if _is_need_skip_struct(struct_type):
-            continue
+    for struct_type in struct_types:
         lines += _gen_struct_v2(struct_type, struct_infos[struct_type], r_cpp_lines)
 
     lines.append(f"")
@@ -760,12 +747,7 @@ def gen_structs(
     ######### 生成绑定宏 #########
     lines.append("// ====================")
     lines.append(f"#define REGISTER_DATA_CLASSES_OF_{_convert_handle_class_name(handle_class)}()\\")
-    for st in struct_infos:
-        if _is_expanded_struct(st):
-            continue
-        if _is_need_skip_struct(st):
-            continue
-        lines.append(f"\tGDREGISTER_CLASS(godot::eos::{__convert_to_struct_class(st)})\\")
+    lines += [f"\tGDREGISTER_CLASS(godot::eos::{__convert_to_struct_class(st)})\\" for st in struct_types]
     __remove_backslash_of_last_line(lines)
     lines.append("")
     return lines
@@ -801,7 +783,7 @@ def gen_packed_results(file_base_name: str, types_include_file: str, register_ma
     return ret
 
 
-def gen_handles(interface_handle_class: str, additional_include_lines: list[str], p_handles: dict, r_cpp_lines: list[str]) -> list[str]:
+def gen_handles(interface_handle_class: str, additional_include_lines: list[str], p_handles: dict, r_cpp_lines: deque[str]) -> list[str]:
     register_lines: list[str] = [f"#define REGISTER_HANDLES_OF_{_convert_handle_class_name(interface_handle_class)}()\\"]
 
     h_lines: list[str] = [f"#pragma once"]
@@ -879,7 +861,7 @@ def _gen_handle(
     handle_name: str,
     infos: dict,
     macro_suffix: str,
-    r_cpp_lines: list[str],
+    r_cpp_lines: deque[str],
     r_register_lines: list[str],
     need_singleton: bool = False,
 ) -> list[str]:
@@ -1037,10 +1019,14 @@ def _gen_handle(
     if base_class in [_convert_handle_class_name("EOS_HAntiCheatCommon")]:
         base_class = "Object"
 
-    ret.append("namespace godot::eos {")
-    ret.append(f"class {klass} : {inherits} {{")
-    ret.append(f"\tGDCLASS({klass}, {base_class})")
-    ret.append(f"")
+    ret.extend(
+        (
+            "namespace godot::eos {",
+            f"class {klass} : {inherits} {{",
+            f"\tGDCLASS({klass}, {base_class})",
+            "",
+        )
+    )
     if not is_base_handle_type:
         ret.append(f"\t{handle_name} m_handle{{ nullptr }};")
         ret.append(f"")
@@ -1055,10 +1041,7 @@ def _gen_handle(
         ret.append("public:")
         ret.append("\tstatic Callable &get_log_message_callback() {{ static Callable ret; return ret; }}")
 
-    ret.append(f"protected:")
-    ret.append(f"\tstatic void _bind_methods();")
-    ret.append(f"")
-    ret.append(f"public:")
+    ret.extend(("protected:", "\tstatic void _bind_methods();", "", "public:"))
     # USING 枚举
     if len(infos["enums"]):
         ret.append(f"\t_USING_ENUMS_{macro_suffix}()")
@@ -1100,21 +1083,25 @@ def _gen_handle(
 
     # _to_string
     if handle_name in ["EOS_ProductUserId", "EOS_EpicAccountId"]:
-        r_cpp_lines.append(f"String {klass}::_to_string() const {{")
-        r_cpp_lines.append(f'\tString str{{"Invalid"}};')
-        r_cpp_lines.append(f"\tif (m_handle) {{")
-        r_cpp_lines.append(f"\t\tchar OutBuffer [{handle_name.upper()}_MAX_LENGTH + 1] {{}};")
-        r_cpp_lines.append(f"\t\tint32_t InOutBufferLength{{ {handle_name.upper()}_MAX_LENGTH + 1 }};")
-        r_cpp_lines.append(f"\t\tEOS_EResult result_code = {handle_name}_ToString(m_handle, &OutBuffer[0], &InOutBufferLength);")
-        r_cpp_lines.append(f"\t\tEOS::_set_last_result_code(result_code);")
-        r_cpp_lines.append(f"\t\tif (result_code != EOS_EResult::EOS_Success) {{")
-        r_cpp_lines.append(f"\t\t\tstr = EOS_EResult_ToString(result_code);")
-        r_cpp_lines.append(f"\t\t}} else {{")
-        r_cpp_lines.append(f"\t\t\tstr = &OutBuffer[0];")
-        r_cpp_lines.append(f"\t\t}}")
-        r_cpp_lines.append(f"\t}}")
-        r_cpp_lines.append(f'\treturn vformat("[{klass}:%s]", str);')
-        r_cpp_lines.append(f"}}")
+        r_cpp_lines.extend(
+            (
+                f"String {klass}::_to_string() const {{",
+                '\tString str{"Invalid"};',
+                "\tif (m_handle) {",
+                f"\t\tchar OutBuffer [{handle_name.upper()}_MAX_LENGTH + 1] {{}};",
+                f"\t\tint32_t InOutBufferLength{{ {handle_name.upper()}_MAX_LENGTH + 1 }};",
+                f"\t\tEOS_EResult result_code = {handle_name}_ToString(m_handle, &OutBuffer[0], &InOutBufferLength);",
+                "\t\tEOS::_set_last_result_code(result_code);",
+                "\t\tif (result_code != EOS_EResult::EOS_Success) {",
+                "\t\t\tstr = EOS_EResult_ToString(result_code);",
+                "\t\t} else {",
+                "\t\t\tstr = &OutBuffer[0];",
+                "\t\t}",
+                "\t}",
+                f'\treturn vformat("[{klass}:%s]", str);',
+                "}",
+            )
+        )
     else:
         r_cpp_lines.append(f'String {klass}::_to_string() const {{ return vformat("<{klass}#%d>", get_instance_id()); }}')
     r_cpp_lines.append("")
@@ -1175,6 +1162,7 @@ def _get_base_class(handle_type: str) -> str:
         return "RefCounted"
 
 
+@lru_cache(maxsize=None)
 def _convert_to_interface_lower(file_name: str) -> str:
     splits = file_name.rsplit("\\", 1)
     f: str = splits[len(splits) - 1]
@@ -1187,73 +1175,79 @@ def _convert_to_interface_lower(file_name: str) -> str:
     return f.removesuffix("_types.h").removesuffix(".h").replace("_sdk", "_platform").removeprefix("eos_")
 
 
+# 方法 -> 视为其成员方法的句柄类型
+_CHEAT_HANDLE_METHODS: dict[str, str] = {
+    "EOS_IntegratedPlatform_CreateIntegratedPlatformOptionsContainer": "EOS_HIntegratedPlatform",
+    "EOS_EpicAccountId_FromString": "EOS_EpicAccountId",
+    "EOS_ProductUserId_FromString": "EOS_ProductUserId",
+    # 公用（common）
+    "EOS_EResult_ToString": "EOS",
+    "EOS_EResult_IsOperationComplete": "EOS",
+    "EOS_ByteArray_ToString": "EOS",
+    "EOS_EApplicationStatus_ToString": "EOS",
+    "EOS_ENetworkStatus_ToString": "EOS",
+    "EOS_Logging_SetCallback": "EOS",
+    "EOS_Logging_SetLogLevel": "EOS",
+    #
+    "EOS_Initialize": "EOS",
+    "EOS_Shutdown": "EOS",
+    "EOS_Platform_Create": "EOS_HPlatform",
+}
+
+
 def _cheat_as_handle_method(method_name: str) -> str:
-    map = {
-        "EOS_IntegratedPlatform_CreateIntegratedPlatformOptionsContainer": "EOS_HIntegratedPlatform",
-        "EOS_EpicAccountId_FromString": "EOS_EpicAccountId",
-        "EOS_ProductUserId_FromString": "EOS_ProductUserId",
-        # 公用（common）
-        "EOS_EResult_ToString": "EOS",
-        "EOS_EResult_IsOperationComplete": "EOS",
-        "EOS_ByteArray_ToString": "EOS",
-        "EOS_EApplicationStatus_ToString": "EOS",
-        "EOS_ENetworkStatus_ToString": "EOS",
-        "EOS_Logging_SetCallback": "EOS",
-        "EOS_Logging_SetLogLevel": "EOS",
-        #
-        "EOS_Initialize": "EOS",
-        "EOS_Shutdown": "EOS",
-        "EOS_Platform_Create": "EOS_HPlatform",
-    }
-    return map.get(method_name, "")
+    return _CHEAT_HANDLE_METHODS.get(method_name, "")
+
+
+# 枚举 -> 视为其成员枚举的句柄类型
+_CHEAT_HANDLE_ENUMS: dict[str, str] = {
+    # Log (不单独开一个类)
+    "EOS_ELogLevel": "EOS",
+    "EOS_ELogCategory": "EOS",
+    # 公用（common）
+    "EOS_ELoginStatus": "EOS",
+    "EOS_EAttributeType": "EOS",
+    "EOS_EComparisonOp": "EOS",
+    "EOS_EExternalAccountType": "EOS",
+    "EOS_EExternalCredentialType": "EOS",
+    "EOS_EResult": "EOS",
+    #
+    "EOS_ERTCBackgroundMode": "EOS",
+    "EOS_EApplicationStatus": "EOS",
+    "EOS_ENetworkStatus": "EOS",
+    "EOS_EDesktopCrossplayStatus": "EOS",
+    #
+}
 
 
 def _cheat_as_handle_enum(enum_type: str) -> str:
     if enum_type.startswith("EOS_EAntiCheatCommon"):
         return "EOS_HAntiCheatCommon"
-    map = {
-        # Log (不单独开一个类)
-        "EOS_ELogLevel": "EOS",
-        "EOS_ELogCategory": "EOS",
-        # 公用（common）
-        "EOS_ELoginStatus": "EOS",
-        "EOS_EAttributeType": "EOS",
-        "EOS_EComparisonOp": "EOS",
-        "EOS_EExternalAccountType": "EOS",
-        "EOS_EExternalCredentialType": "EOS",
-        "EOS_EResult": "EOS",
-        #
-        "EOS_ERTCBackgroundMode": "EOS",
-        "EOS_EApplicationStatus": "EOS",
-        "EOS_ENetworkStatus": "EOS",
-        "EOS_EDesktopCrossplayStatus": "EOS",
-        #
-    }
-    return map.get(enum_type, "")
+    return _CHEAT_HANDLE_ENUMS.get(enum_type, "")
+
+
+# 回调 -> 视为其成员回调的句柄类型
+_CHEAT_HANDLE_CALLBACKS: dict[str, str] = {
+    "EOS_TitleStorage_OnReadFileDataCallback": "EOS_HTitleStorageFileTransferRequest",
+    "EOS_TitleStorage_OnFileTransferProgressCallback": "EOS_HTitleStorageFileTransferRequest",
+    "EOS_PlayerDataStorage_OnReadFileDataCallback": "EOS_HPlayerDataStorageFileTransferRequest",
+    "EOS_PlayerDataStorage_OnWriteFileDataCallback": "EOS_HPlayerDataStorageFileTransferRequest",
+    "EOS_PlayerDataStorage_OnFileTransferProgressCallback": "EOS_HPlayerDataStorageFileTransferRequest",
+    #
+    # "EOS_TitleStorage_OnReadFileCompleteCallback": "EOS_HTitleStorageFileTransferRequest",
+    # "EOS_PlayerDataStorage_OnReadFileCompleteCallback": "EOS_HPlayerDataStorageFileTransferRequest",
+    # "EOS_PlayerDataStorage_OnWriteFileCompleteCallback": "EOS_HPlayerDataStorageFileTransferRequest",
+    "EOS_LogMessageFunc": "EOS",
+}
 
 
 def _cheat_as_handle_callback(callback_type: str) -> str:
-    map = {
-        "EOS_TitleStorage_OnReadFileDataCallback": "EOS_HTitleStorageFileTransferRequest",
-        "EOS_TitleStorage_OnFileTransferProgressCallback": "EOS_HTitleStorageFileTransferRequest",
-        "EOS_PlayerDataStorage_OnReadFileDataCallback": "EOS_HPlayerDataStorageFileTransferRequest",
-        "EOS_PlayerDataStorage_OnWriteFileDataCallback": "EOS_HPlayerDataStorageFileTransferRequest",
-        "EOS_PlayerDataStorage_OnFileTransferProgressCallback": "EOS_HPlayerDataStorageFileTransferRequest",
-        #
-        # "EOS_TitleStorage_OnReadFileCompleteCallback": "EOS_HTitleStorageFileTransferRequest",
-        # "EOS_PlayerDataStorage_OnReadFileCompleteCallback": "EOS_HPlayerDataStorageFileTransferRequest",
-        # "EOS_PlayerDataStorage_OnWriteFileCompleteCallback": "EOS_HPlayerDataStorageFileTransferRequest",
-        "EOS_LogMessageFunc": "EOS",
-    }
-    return map.get(callback_type, "")
+    return _CHEAT_HANDLE_CALLBACKS.get(callback_type, "")
 
 
-def _cheat_as_handle_constant(constant_name: str) -> str:
-    if constant_name.startswith("EOS_ANTICHEATCOMMON_"):
-        return "EOS_HAntiCheatCommon"
-    if constant_name.startswith("EOS_IPT_"):
-        return "EOS_HIntegratedPlatform"
-    if constant_name in [
+# 视为 EOS 类成员的常量（另有 "EOS_OPT_" 前缀的常量）
+_CHEAT_EOS_CONSTANTS: frozenset[str] = frozenset(
+    [
         "EOS_EPICACCOUNTID_MAX_LENGTH",
         "EOS_PRODUCTUSERID_MAX_LENGTH",
         "EOS_INVALID_NOTIFICATIONID",
@@ -1261,11 +1255,39 @@ def _cheat_as_handle_constant(constant_name: str) -> str:
         "EOS_PAGEQUERY_MAXCOUNT_MAXIMUM",
         "EOS_INITIALIZEOPTIONS_PRODUCTNAME_MAX_LENGTH",
         "EOS_INITIALIZEOPTIONS_PRODUCTVERSION_MAX_LENGTH",
-    ] or constant_name.startswith("EOS_OPT_"):
+    ]
+)
+
+
+def _cheat_as_handle_constant(constant_name: str) -> str:
+    if constant_name.startswith("EOS_ANTICHEATCOMMON_"):
+        return "EOS_HAntiCheatCommon"
+    if constant_name.startswith("EOS_IPT_"):
+        return "EOS_HIntegratedPlatform"
+    if constant_name in _CHEAT_EOS_CONSTANTS or constant_name.startswith("EOS_OPT_"):
         return "EOS"
     return ""
 
 
+# 获取接口的方法，如 EOS_Platform_GetAchievementsInterface -> Achievements, EOS_RTC_GetAudioInterface -> RTCAudio
+# 接口前缀部分可含 "_"，拼接时去除
+_IFACE_GET_RE = re.compile(r"EOS_(?:Platform_)?(?:([A-Za-z0-9_]+)_)?Get([A-Za-z0-9]+)Interface")
+
+# 不解析或需要特殊处理的 SDK 头文件
+_SKIP_FILES: frozenset[str] = frozenset(
+    [
+        "eos_base.h",
+        "eos_platform_prereqs.h",
+        "eos_version.h",
+        # "eos_init.h",  # 在EOSCommon::init中使用，不再单独处理
+        #
+        "eos_result.h",
+        "eos_ui_keys.h",
+        "eos_ui_buttons.h",
+    ]
+)
+
+
 def parse_all_file():
     file_lower2infos: dict[str] = {}
     file_lower2infos[_convert_to_interface_lower("eos_common.h")] = {
@@ -1280,27 +1302,24 @@ def parse_all_file():
     }
     file_lower2infos["platform"] = {"file": "eos_sdk", "enums": {}, "methods": {}, "callbacks": {}, "structs": {}, "handles": {}, "constants": {}, "interface_doc": []}
 
-    for f in os.listdir(sdk_include_dir):
-        fp = os.path.join(sdk_include_dir, f)
-        if os.path.isdir(fp):
-            continue
+    parse_jobs: list[tuple[str, str]] = []
+    # 接口 -> 其头文件（按目录遍历顺序）
+    interface2files: dict[str, list[str]] = {}
+    with os.scandir(sdk_include_dir) as entries:
+        sdk_files: list[os.DirEntry] = [entry for entry in entries if not entry.is_dir()]
+    sdk_header_files.clear()
+    sdk_header_files.update(entry.name for entry in sdk_files)
+    for entry in sdk_files:
+        f = entry.name
+        fp = entry.path
 
         if "deprecated" in f:
             continue
 
-        if f in [
-            "eos_base.h",
-            "eos_platform_prereqs.h",
-            "eos_version.h",
-            # "eos_init.h",  # 在EOSCommon::init中使用，不再单独处理
-            #
-            "eos_result.h",
-            "eos_ui_keys.h",
-            "eos_ui_buttons.h",
-        ]:  # 特殊处理
+        if f in _SKIP_FILES:  # 特殊处理
             continue
         interface_lower = _convert_to_interface_lower(f)
-        if not interface_lower in file_lower2infos.keys():
+        if not interface_lower in file_lower2infos:
             file_lower2infos[interface_lower] = {
                 "file": f.removesuffix("_types.h").removesuffix(".h"),
                 "methods": {},  # 最终为空
@@ -1311,78 +1330,116 @@ def parse_all_file():
                 "constants": {},  # 最终为空
                 "interface_doc": [],  # 最终为空
             }
-        _parse_file(interface_lower, fp, file_lower2infos)
+        parse_jobs.append((interface_lower, fp))
+        interface2files.setdefault(interface_lower, []).append(fp)
+
+    # 同一接口的头文件之间存在依赖（接口说明仅从第一个提取到说明的头文件中获取，之后的头文件不再扫描），
+    # 因此以接口为单位按顺序解析，不同接口之间使用多进程并行解析，之后按原文件顺序合并
+    # 先在主进程中读取缓存，仅将未命中的部分交给进程池
+    parsed_results: dict[str, dict] = {}
+    miss_jobs: list[tuple[str, list[str], bool]] = []
+    for interface_lower in interface2files:
+        fps: list[str] = interface2files[interface_lower]
+        need_interface_doc: bool = True
+        for idx, fp in enumerate(fps):
+            parsed = _load_parse_cache(fp, need_interface_doc)
+            if parsed is None:
+                # 后续头文件依赖该文件的解析结果，一并交给进程池
+                miss_jobs.append((interface_lower, fps[idx:], need_interface_doc))
+                break
+            parsed_results[fp] = parsed
+            need_interface_doc = need_interface_doc and len(parsed["interface_doc"]) <= 0
+    if len(miss_jobs) == 1:
+        # 仅有一个任务时直接在当前进程解析，省去启动进程池的开销
+        parsed_results.update(zip(miss_jobs[0][1], _parse_interface_files(*miss_jobs[0])))
+    elif len(miss_jobs) > 1:
+        try:
+            with ProcessPoolExecutor(max_workers=min(len(miss_jobs), os.cpu_count() or 1)) as executor:
+                for job, results in zip(miss_jobs, executor.map(_parse_interface_files, *zip(*miss_jobs))):
+                    parsed_results.update(zip(job[1], results))
+        except (BrokenProcessPool, OSError, pickle.PicklingError) as e:
+            # 进程池不可用时退回到当前进程中依次解析
+            print("WARN: parallel parsing failed, fallback to sequential parsing:", repr(e))
+            for job in miss_jobs:
+                parsed_results.update(zip(job[1], _parse_interface_files(*job)))
+    for interface_lower, fp in parse_jobs:
+        _merge_parsed_file_infos(file_lower2infos[interface_lower], parsed_results[fp])
 
     _get_EOS_EResult(file_lower2infos)
     _get_EOS_UI_EKeyCombination(file_lower2infos)
     _get_EOS_UI_EInputStateButtonFlags(file_lower2infos)
 
-    extra_handles_methods: dict[str, dict] = {}
-    # 将方法、回调，移动到对应的handle中,并检出接口类
+    extra_handles_methods: defaultdict[str, dict] = defaultdict(dict)
+    # 句柄类型 -> 所属接口的句柄字典，重复时以先出现者为准
+    handle_index: dict[str, dict] = {}
     for il in file_lower2infos:
-        _handles = file_lower2infos[il]["handles"]
+        for h in file_lower2infos[il]["handles"]:
+            if not h in handle_index:
+                handle_index[h] = file_lower2infos[il]["handles"]
+    # 首个接口的句柄优先于 Release 方法的特殊处理，与逐接口匹配时的顺序一致
+    first_handles: dict[str, dict] = next(iter(file_lower2infos.values()))["handles"]
 
-        for infos in file_lower2infos.values():
-            methods: dict[str, dict] = infos["methods"]
-            to_remove_methods: list[str] = []
-            for method_name in methods.keys():
-                handle_type: str = ""
-                callback_type: str = ""
-
-                # 获取接口方法
-                if "_Get" in method_name and method_name.endswith("Interface"):
-                    splits: list[str] = method_name.split("_")
-                    for i in range(len(splits)):
-                        if splits[i] in ["EOS", "Platform"]:
-                            splits[i] = ""
-                        if splits[i].startswith("Get"):
-                            splits[i] = splits[i].removeprefix("Get")
-                        if splits[i].removesuffix("Interface"):
-                            splits[i] = splits[i].removesuffix("Interface")
-                    interfaces["".join(splits)] = methods[method_name]
-                    to_remove_methods.append(method_name)
+    # 将方法、回调，移动到对应的handle中,并检出接口类
+    for infos in file_lower2infos.values():
+        methods: dict[str, dict] = infos["methods"]
+        to_remove_methods: list[str] = []
+        for method_name in methods:
+            handle_type: str = ""
+            callback_type: str = ""
+            owner_handles: dict[str, dict] = {}
+
+            # 获取接口方法
+            if "_Get" in method_name and method_name.endswith("Interface"):
+                interface_getter_match = _IFACE_GET_RE.fullmatch(method_name)
+                if interface_getter_match is None:
+                    print("ERROR: unrecognized interface getter:", method_name)
+                    _print_stack_and_exit()
+                interface_prefix: str = (interface_getter_match.group(1) or "").replace("_", "")
+                interfaces[interface_prefix + interface_getter_match.group(2)] = methods[method_name]
+                to_remove_methods.append(method_name)
 
-                    handle_type = _decay_eos_type(methods[method_name]["args"][0]["type"])
-                    if not handle_type in extra_handles_methods:
-                        extra_handles_methods[handle_type] = {}
-                    extra_handles_methods[handle_type][method_name] = methods[method_name]
-                    continue
+                handle_type = _decay_eos_type(methods[method_name]["args"][0]["type"])
+                extra_handles_methods[handle_type][method_name] = methods[method_name]
+                continue
 
-                # 句柄方法
-                for i in range(len(methods[method_name]["args"])):
-                    arg: dict[str, str] = methods[method_name]["args"][i]
-                    arg_type = _decay_eos_type(arg["type"])
-                    if arg_type in _handles.keys() and i == 0:
-                        # 移动到对应的handle中
-                        if not method_name in to_remove_methods:
-                            handle_type = arg_type
-                            _handles[handle_type]["methods"][method_name] = methods[method_name]
-                            to_remove_methods.append(method_name)
-                    elif i == 0 and _is_handle_type(arg_type) and method_name.endswith("_Release"):
-                        handle_type = _decay_eos_type(methods[method_name]["args"][0]["type"])
-                        if not handle_type in extra_handles_methods:
-                            extra_handles_methods[handle_type] = {}
+            # 句柄方法
+            for i in range(len(methods[method_name]["args"])):
+                arg: dict[str, str] = methods[method_name]["args"][i]
+                arg_type = _decay_eos_type(arg["type"])
+                if i == 0:
+                    indexed_handles = handle_index.get(arg_type)
+                    if indexed_handles is not first_handles and _is_handle_type(arg_type) and method_name.endswith("_Release"):
+                        handle_type = arg_type
                         extra_handles_methods[handle_type][method_name] = methods[method_name]
                         to_remove_methods.append(method_name)
+                    elif indexed_handles is not None:
+                        # 移动到对应的handle中
+                        handle_type = arg_type
+                        owner_handles = indexed_handles
+                        owner_handles[handle_type]["methods"][method_name] = methods[method_name]
+                        to_remove_methods.append(method_name)
 
-                    if arg_type.endswith("Callback") or arg_type.endswith("CallbackV2"):
-                        # 需要被移动的回调
-                        callback_type = arg_type
+                if arg_type.endswith("Callback") or arg_type.endswith("CallbackV2"):
+                    # 需要被移动的回调
+                    callback_type = arg_type
 
-                # Release 方法
-                if method_name.endswith("_Release"):
-                    if not len(handle_type):
-                        release_methods[method_name] = methods[method_name]
-                        to_remove_methods.append(method_name)
-                        continue
+            # Release 方法
+            if method_name.endswith("_Release"):
+                if not len(handle_type):
+                    release_methods[method_name] = methods[method_name]
+                    to_remove_methods.append(method_name)
+                    continue
+
+            # 移动回调类型
+            if len(owner_handles) and len(callback_type):
+                owner_handles[handle_type]["callbacks"][callback_type] = infos["callbacks"][callback_type]
+                infos["callbacks"].pop(callback_type)
 
-                # 移动回调类型
-                if len(handle_type) and len(callback_type):
-                    _handles[handle_type]["callbacks"][callback_type] = infos["callbacks"][callback_type]
-                    infos["callbacks"].pop(callback_type)
+        for m in to_remove_methods:
+            infos["methods"].pop(m)
 
-            for m in to_remove_methods:
-                infos["methods"].pop(m)
+    for il in file_lower2infos:
+        _handles = file_lower2infos[il]["handles"]
 
         # 处理接口句柄文档
         interface_doc: list[str] = file_lower2infos[il]["interface_doc"]
@@ -1426,39 +1483,43 @@ def parse_all_file():
 
     # 移动句柄
     for il in file_lower2infos:
-        for h in file_lower2infos[il]["handles"]:
-            handles[h] = file_lower2infos[il]["handles"][h]
-            generate_infos[file_lower2infos[il]["file"]]["handles"][h] = file_lower2infos[il]["handles"][h]
-        file_lower2infos[il].pop("handles")
+        _handles = file_lower2infos[il].pop("handles")
+        handles.update(_handles)
+        generate_infos[file_lower2infos[il]["file"]]["handles"].update(_handles)
 
     generate_infos["eos_common"]["handles"]["EOS"] = handles["EOS"]
     generate_infos["eos_anticheatcommon"]["handles"]["EOS_HAntiCheatCommon"] = handles["EOS_HAntiCheatCommon"]
 
     # 移动结构体
     for il in file_lower2infos:
-        for s in file_lower2infos[il]["structs"]:
-            structs[s] = file_lower2infos[il]["structs"][s]
-            generate_infos[file_lower2infos[il]["file"]]["structs"][s] = file_lower2infos[il]["structs"][s]
-        file_lower2infos[il].pop("structs")
+        _structs = file_lower2infos[il].pop("structs")
+        structs.update(_structs)
+        generate_infos[file_lower2infos[il]["file"]]["structs"].update(_structs)
+
+    # 句柄与结构体已全部就位，清空此前基于不完整结果缓存的判断
+    _is_handle_type.cache_clear()
+
+    # 接口名只需转换一次，后续循环复用
+    il2interface: dict[str, str] = {il: _convert_interface_class_name(il).removeprefix("EOS") for il in file_lower2infos}
 
     # 移动枚举
     for il in file_lower2infos:
-        interface = _convert_interface_class_name(il).removeprefix("EOS")
+        interface = il2interface[il]
         if interface in interfaces:
-            handles["EOS_H" + interface]["enums"] = file_lower2infos[il]["enums"]
-            for e in file_lower2infos[il]["enums"]:
-                generate_infos[file_lower2infos[il]["file"]]["handles"]["EOS_H" + interface]["enums"][e] = file_lower2infos[il]["enums"][e]
-            file_lower2infos[il].pop("enums")  # 容器为引用类型，不能直接clear()
+            handle_type = "EOS_H" + interface
+            _enums = file_lower2infos[il].pop("enums")  # 容器为引用类型，不能直接clear()
+            handles[handle_type]["enums"] = _enums
+            generate_infos[file_lower2infos[il]["file"]]["handles"][handle_type]["enums"].update(_enums)
             file_lower2infos[il]["enums"] = {}
 
     # 移动常量
     for il in file_lower2infos:
-        interface = _convert_interface_class_name(il).removeprefix("EOS")
+        interface = il2interface[il]
         if interface in interfaces:
-            handles["EOS_H" + interface]["constants"] = file_lower2infos[il]["constants"]
-            for e in file_lower2infos[il]["constants"]:
-                generate_infos[file_lower2infos[il]["file"]]["handles"]["EOS_H" + interface]["constants"][e] = file_lower2infos[il]["constants"][e]
-            file_lower2infos[il].pop("constants")  # 容器为引用类型，不能直接clear()
+            handle_type = "EOS_H" + interface
+            _constants = file_lower2infos[il].pop("constants")  # 容器为引用类型，不能直接clear()
+            handles[handle_type]["constants"] = _constants
+            generate_infos[file_lower2infos[il]["file"]]["handles"][handle_type]["constants"].update(_constants)
             file_lower2infos[il]["constants"] = {}
 
     # Cheat as handle's method
@@ -1558,48 +1619,36 @@ def parse_all_file():
     # Check
     # 未处理的方法、回调、枚举
     for il in file_lower2infos:
-        for cb in file_lower2infos[il]["callbacks"]:
-            unhandled_callbacks[cb] = file_lower2infos[il]["callbacks"][cb]
-            generate_infos[file_lower2infos[il]["file"]]["callbacks"][cb] = file_lower2infos[il]["callbacks"][cb]
+        _generate_infos = generate_infos[file_lower2infos[il]["file"]]
+
+        unhandled_callbacks.update(file_lower2infos[il]["callbacks"])
+        _generate_infos["callbacks"].update(file_lower2infos[il]["callbacks"])
 
-        for m in file_lower2infos[il]["methods"]:
-            unhandled_methods[m] = file_lower2infos[il]["methods"][m]
-            generate_infos[file_lower2infos[il]["file"]]["methods"][m] = file_lower2infos[il]["methods"][m]
+        unhandled_methods.update(file_lower2infos[il]["methods"])
+        _generate_infos["methods"].update(file_lower2infos[il]["methods"])
 
-        for e in file_lower2infos[il]["enums"]:
-            unhandled_enums[e] = file_lower2infos[il]["enums"][e]
-            generate_infos[file_lower2infos[il]["file"]]["enums"][e] = file_lower2infos[il]["enums"][e]
+        unhandled_enums.update(file_lower2infos[il]["enums"])
+        _generate_infos["enums"].update(file_lower2infos[il]["enums"])
 
-        for c in file_lower2infos[il]["constants"]:
-            unhandled_constants[c] = file_lower2infos[il]["constants"][c]
-            generate_infos[file_lower2infos[il]["file"]]["constants"][c] = file_lower2infos[il]["constants"][c]
+        unhandled_constants.update(file_lower2infos[il]["constants"])
+        _generate_infos["constants"].update(file_lower2infos[il]["constants"])
 
         if len(file_lower2infos[il]["callbacks"]):
-            if not il in unhandled_infos:
-                unhandled_infos[il] = {}
-            unhandled_infos[il]["callbacks"] = file_lower2infos[il]["callbacks"]
+            unhandled_infos.setdefault(il, {})["callbacks"] = file_lower2infos[il]["callbacks"]
         if len(file_lower2infos[il]["methods"]):
-            if not il in unhandled_infos:
-                unhandled_infos[il] = {}
-            unhandled_infos[il]["methods"] = file_lower2infos[il]["methods"]
+            unhandled_infos.setdefault(il, {})["methods"] = file_lower2infos[il]["methods"]
         if len(file_lower2infos[il]["enums"]):
-            if not il in unhandled_infos:
-                unhandled_infos[il] = {}
-            unhandled_infos[il]["enums"] = file_lower2infos[il]["enums"]
+            unhandled_infos.setdefault(il, {})["enums"] = file_lower2infos[il]["enums"]
         if len(file_lower2infos[il]["constants"]):
-            if not il in unhandled_infos:
-                unhandled_infos[il] = {}
             print(file_lower2infos[il]["constants"].keys())
-            unhandled_infos[il]["constants"] = file_lower2infos[il]["constants"]
+            unhandled_infos.setdefault(il, {})["constants"] = file_lower2infos[il]["constants"]
 
         file_lower2infos[il].pop("callbacks")
         file_lower2infos[il].pop("methods")
         file_lower2infos[il].pop("enums")
         file_lower2infos[il].pop("constants")
 
-    classes: list[str] = []
-    for il in file_lower2infos.keys():
-        classes.append(_convert_interface_class_name(il).removeprefix("EOS"))
+    classes: list[str] = list(il2interface.values())
 
     for up in interfaces:
         if not up in classes:
@@ -1607,8 +1656,19 @@ def parse_all_file():
         else:
             classes.remove(up)
 
+    _index_enum_owners()
+    _index_callback_methods()
     _make_additional_method_requirements()
 
+    # 以下缓存依赖解析结果，解析完成后清空以免保留解析期间的中间结果
+    remap_type.cache_clear()
+    __get_api_latest_macro.cache_clear()
+    __find_count_and_variant_type_fields_in_struct.cache_clear()
+    _plan_struct.cache_clear()
+    _is_internal_struct_field.cache_clear()
+    _is_arr_field.cache_clear()
+    _is_handle_type.cache_clear()
+
     # print(classes)
     # print(interfaces.keys())
 
@@ -1618,6 +1678,26 @@ def parse_all_file():
         )
 
 
+# 接口名各段的特殊大小写，未列出的段首字母大写
+_PART_REMAP: dict[str, str] = {
+    "rtc": "RTC",
+    "p2p": "P2P",
+    "ui": "UI",
+    "playerdatastorage": "PlayerDataStorage",
+    "sdk": "Platform",
+    "userinfo": "UserInfo",
+    "titlestorage": "TitleStorage",
+    "anticheatserver": "AntiCheatServer",
+    "anticheatclient": "AntiCheatClient",
+    "anticheatcommon": "AntiCheatCommon",
+    "progressionsnapshot": "ProgressionSnapshot",
+    "kws": "KWS",
+    "custominvites": "CustomInvites",
+    "integratedplatform": "IntegratedPlatform",
+}
+
+
+@lru_cache(maxsize=None)
 def _convert_interface_class_name(interface_name_lower: str) -> str:
     if interface_name_lower in ["eos_common", "common", "e_o_s"]:
         interface_name_lower = "eos"
@@ -1625,40 +1705,11 @@ def _convert_interface_class_name(interface_name_lower: str) -> str:
         return "EOS"
     if interface_name_lower == "eos_userinfo":
         return "EOSUserInfoInterface"
-    name_splits = interface_name_lower.removeprefix("eos_").split("_")
-    for i in range(len(name_splits)):
-        if name_splits[i] in ["rtc", "p2p", "ui"]:
-            name_splits[i] = name_splits[i].upper()
-        elif name_splits[i] == "playerdatastorage":
-            name_splits[i] = "PlayerDataStorage"
-        elif name_splits[i] == "p2p":
-            name_splits[i] = "P2P"
-        elif name_splits[i] == "sdk":
-            name_splits[i] = "Platform"
-        elif name_splits[i] == "userinfo":
-            name_splits[i] = "UserInfo"
-        elif name_splits[i] == "titlestorage":
-            name_splits[i] = "TitleStorage"
-        elif name_splits[i] == "anticheatserver":
-            name_splits[i] = "AntiCheatServer"
-        elif name_splits[i] == "anticheatclient":
-            name_splits[i] = "AntiCheatClient"
-        elif name_splits[i] == "anticheatcommon":
-            name_splits[i] = "AntiCheatCommon"
-        elif name_splits[i] == "progressionsnapshot":
-            name_splits[i] = "ProgressionSnapshot"
-        elif name_splits[i] == "kws":
-            name_splits[i] = "KWS"
-        elif name_splits[i] == "custominvites":
-            name_splits[i] = "CustomInvites"
-        elif name_splits[i] == "integratedplatform":
-            name_splits[i] = "IntegratedPlatform"
-        else:
-            name_splits[i] = name_splits[i].capitalize()
-
-    return "EOS" + "".join(name_splits)
+    name_splits = [_PART_REMAP.get(part) or part.capitalize() for part in interface_name_lower.removeprefix("eos_").split("_")]
+    return sys.intern("EOS" + "".join(name_splits))
 
 
+@lru_cache(maxsize=None)
 def _convert_handle_class_name(handle_type: str) -> str:
     if handle_type == "EOS_HUserInfo":
         return "EOSUserInfoInterface"
@@ -1669,7 +1720,7 @@ def _convert_handle_class_name(handle_type: str) -> str:
         text = text.replace("EOS_", "EOS")
     if not text.startswith("EOS"):
         text = "EOS" + text
-    return text
+    return sys.intern(text)
 
 
 def _is_enum_type(type: str) -> bool:
@@ -1701,7 +1752,7 @@ def _gen_packed_result_type(
     for i in range(len(method_info["args"])):
         arg_name: str = method_info["args"][i]["name"]
         arg_type: str = method_info["args"][i]["type"]
-        if (arg_name.startswith("Out") or arg_name.startswith("InOut") or arg_name.startswith("bOut")) and arg_type.endswith("*"):
+        if arg_name.startswith(_OUT_ARG_PREFIXES) and arg_type.endswith("*"):
             out_args.append(method_info["args"][i])
     if len(out_args) <= 0:
         return ""
@@ -1894,17 +1945,34 @@ def __get_struct_fields(type: str) -> dict[str, dict]:
     return structs[_decay_eos_type(type)]["fields"]
 
 
+def _index_callback_methods() -> None:
+    # 单次遍历所有方法参数，建立回调到方法的索引，供信号命名使用
+    callback2methods.clear()
+    for infos in handles.values():
+        methods = infos["methods"]
+        for m in methods:
+            for a in methods[m]["args"]:
+                callback2methods.setdefault(_decay_eos_type(a["type"]), []).append(m)
+
+
+# 传输完成回调，信号名需要特殊处理
+_TRANSFER_COMPLETE_CALLBACKS: frozenset[str] = frozenset(
+    [
+        "EOS_PlayerDataStorage_OnWriteFileCompleteCallback",
+        "EOS_PlayerDataStorage_OnReadFileCompleteCallback",
+        "EOS_TitleStorage_OnReadFileCompleteCallback",
+    ]
+)
+
+
 def __convert_to_signal_name(callback_type: str, method_name: str = "") -> str:
     if len(method_name) <= 0:
-        for infos in handles.values():
-            methods = infos["methods"]
-            for m in methods:
-                for a in methods[m]["args"]:
-                    if _decay_eos_type(a["type"]) == callback_type:
-                        if len(method_name):
-                            print("ERROR: ", callback_type, method_name)
-                            _print_stack_and_exit()
-                        method_name = m
+        methods = callback2methods.get(callback_type, [])
+        if len(methods) > 1:
+            print("ERROR: ", callback_type, methods[0])
+            _print_stack_and_exit()
+        if len(methods):
+            method_name = methods[0]
 
     ret = to_snake_case(callback_type.rsplit("_", 1)[1])
     if ret.endswith("_callback_v2"):
@@ -1912,12 +1980,7 @@ def __convert_to_signal_name(callback_type: str, method_name: str = "") -> str:
     ret = ret.removesuffix("_callback")
     if "AddNotify" in method_name:
         ret = ret.removeprefix("on_")
-    elif callback_type in [
-        # 对传输完成信号名进行特殊处理
-        "EOS_PlayerDataStorage_OnWriteFileCompleteCallback",
-        "EOS_PlayerDataStorage_OnReadFileCompleteCallback",
-        "EOS_TitleStorage_OnReadFileCompleteCallback",
-    ]:
+    elif callback_type in _TRANSFER_COMPLETE_CALLBACKS:
         ret = ret.removeprefix("on_") + "d"
     return ret
 
@@ -1950,8 +2013,41 @@ def _need_check_null_local_user_id_struct(struct_type: str) -> bool:
     )
 
 
+@lru_cache(maxsize=None)
 def __convert_to_struct_class(struct_type: str) -> str:
-    return _decay_eos_type(struct_type).replace("EOS_", "EOS")
+    return sys.intern(_decay_eos_type(struct_type).replace("EOS_", "EOS"))
+
+
+# 回调展开字段类别 -> 展开为参数的代码格式
+_EXPAND_FMTS: dict[str, str] = {
+    "enum": "_EXPAND_TO_GODOT_VAL({type}, data->{field})",
+    "enum_flags": "_EXPAND_TO_GODOT_VAL_FLAGS({type}, data->{field})",
+    "pure_handle": "_EXPAND_TO_GODOT_VAL_PURE_HANDLE(data->{field})",
+    "socket_id": "String(data->{field}.SocketName)",
+    "requested_channel": "_EXPAND_TO_GODOT_VAL_REQUESTED_CHANNEL({type}, data->{field})",
+    "union": "_EXPAND_TO_GODOT_VAL_UNION({type}, data->{field})",
+    "struct_arr": "_EXPAND_TO_GODOT_VAL_STRUCT_ARR({decayed_type}, data->{field}, {count_field})",
+    "struct": "_EXPAND_TO_GODOT_VAL_STRUCT({decayed_type}, data->{field})",
+    "handle_arr": "_EXPAND_TO_GODOT_VAL_HANDLER_ARR({handle_class}, data->{field}, {count_field})",
+    "handle": "_EXPAND_TO_GODOT_VAL_HANDLER({handle_class}, data->{field})",
+    "arr": "_EXPAND_TO_GODOT_VAL_ARR({type}, data->{field}, data->{count_field})",
+    "value": "_EXPAND_TO_GODOT_VAL({type}, data->{field})",
+}
+# 回调展开字段类别 -> 信号参数的属性信息格式
+_BIND_FMTS: dict[str, str] = {
+    "enum": "_MAKE_PROP_INFO_ENUM({snake_field}, {enum_owner}, {enum_type})",
+    "enum_flags": "_MAKE_PROP_INFO_ENUM({snake_field}, {enum_owner}, {enum_type})",
+    "pure_handle": "_MAKE_PROP_INFO({type}, {snake_field})",
+    "socket_id": 'PropertyInfo(Variant::STRING, "{snake_field}")',
+    "requested_channel": 'PropertyInfo(Variant::INT, "{snake_field}")',
+    "union": 'PropertyInfo(Variant::NIL, "{snake_field}")',
+    "struct_arr": 'PropertyInfo(Variant::ARRAY, "{snake_field}", PROPERTY_HINT_ARRAY_TYPE, "{struct_class}")',
+    "struct": "_MAKE_PROP_INFO({struct_class}, {snake_field})",
+    "handle_arr": "_MAKE_PROP_INFO_TYPED_ARR({handle_class}, {snake_field})",
+    "handle": "_MAKE_PROP_INFO({handle_class}, {snake_field})",
+    "arr": 'PropertyInfo(Variant({type}()).get_type(), "{snake_field}")',
+    "value": 'PropertyInfo(Variant({type}()).get_type(), "{snake_field}")',
+}
 
 
 def _gen_callback(
@@ -2003,12 +2099,12 @@ def _gen_callback(
     else:
         fields: dict[str, str] = __get_struct_fields(_decay_eos_type(arg_type))
 
-        ## 检出不需要成为参数的字段
-        count_and_variant_type_fields: list[str] = __find_count_and_variant_type_fields_in_struct(_decay_eos_type(arg_type))
+        ## 检出需要成为参数的字段及其类别
+        field_kinds: dict[str, tuple[str, str]] = _plan_struct(_decay_eos_type(arg_type))
 
         ##
-        ret: str = ""
-        signal_bind_args: str = ""
+        expand_args: list[str] = []
+        signal_bind_args: list[str] = [f'"{signal_name}"']
 
         expanded_args_doc: dict[str, list[str]] = {}
 
@@ -2018,92 +2114,57 @@ def _gen_callback(
             print("ERROR unsupported callback type:", callback_type)
             _print_stack_and_exit()
         else:
-            ret = f'\n\t\t_EOS_METHOD_CALLBACK_EXPANDED({arg_type}, data, "{signal_name}"'
+            expand_args.append(f'\n\t\t_EOS_METHOD_CALLBACK_EXPANDED({arg_type}, data, "{signal_name}"')
 
-        for field in fields:
+        for field in field_kinds:
             field_type: str = fields[field]["type"]
-            if __is_api_version_field(field_type, field):
-                continue
-
-            if is_deprecated_field(field) or field in count_and_variant_type_fields:
-                continue
-
-            if _is_client_data_field(field_type, field):
-                # 接口与回调不再含有 ClientData
-                continue
-
+            (kind, count_field) = field_kinds[field]
             snake_case_field = to_snake_case(field)
             if assume_only_one_local_user and _is_local_user_id(field) and _need_ignore_local_user_id_struct(struct_type=arg_type):
                 continue  # 不需要绑定该参数
 
-            if not ret.endswith(",\n\t\t\t"):
-                ret += ",\n\t\t\t"
-                signal_bind_args += ", "
-
-            if _is_enum_type(field_type):
-                if _is_enum_flags_type(field_type):
-                    ret += f"_EXPAND_TO_GODOT_VAL_FLAGS({remap_type(field_type)}, data->{field})"
-                else:
-                    ret += f"_EXPAND_TO_GODOT_VAL({remap_type(field_type)}, data->{field})"
-                signal_bind_args += f"_MAKE_PROP_INFO_ENUM({snake_case_field}, {_get_enum_owned_interface(field_type)}, {_convert_enum_type(field_type)})"
-            elif _is_pure_handle_type(_decay_eos_type(field_type)):
-                ret += f"_EXPAND_TO_GODOT_VAL_PURE_HANDLE(data->{field})"
-                signal_bind_args += f"_MAKE_PROP_INFO({remap_type(field_type)}, {snake_case_field})"
-            elif _is_socket_id_type(_decay_eos_type(field_type), field):
-                ret += f"String(data->{field}.SocketName)"
-                signal_bind_args += f'PropertyInfo(Variant::STRING, "{snake_case_field}")'
-            elif _is_requested_channel_ptr_field(field_type, field):
-                ret += f"_EXPAND_TO_GODOT_VAL_REQUESTED_CHANNEL({remap_type(field_type)}, data->{field})"
-                signal_bind_args += f'PropertyInfo(Variant::INT, "{snake_case_field}")'
-            elif field_type.startswith("Union"):
-                ret += f"_EXPAND_TO_GODOT_VAL_UNION({remap_type(field_type)}, data->{field})"
-                signal_bind_args += f'PropertyInfo(Variant::NIL, "{snake_case_field}")'
-            elif _is_internal_struct_arr_field(field_type, field):
-                ret += f"_EXPAND_TO_GODOT_VAL_STRUCT_ARR({remap_type(_decay_eos_type(field_type))}, data->{field}, {_find_count_field(field, fields.keys())})"
-                signal_bind_args += f'PropertyInfo(Variant::ARRAY, "{snake_case_field}", PROPERTY_HINT_ARRAY_TYPE, "{__convert_to_struct_class(_decay_eos_type(field_type))}")'
-            elif _is_internal_struct_field(field_type, field):
-                ret += f"_EXPAND_TO_GODOT_VAL_STRUCT({remap_type(_decay_eos_type(field_type))}, data->{field})"
-                signal_bind_args += f"_MAKE_PROP_INFO({__convert_to_struct_class(_decay_eos_type(field_type))}, {snake_case_field})"
-            elif _is_handle_arr_type(field_type, field):
-                ret += f"_EXPAND_TO_GODOT_VAL_HANDLER_ARR({_convert_handle_class_name(_decay_eos_type(field_type))}, data->{field}, {_find_count_field(field, fields.keys())})"
-                signal_bind_args += f"_MAKE_PROP_INFO_TYPED_ARR({_convert_handle_class_name(_decay_eos_type(field_type))}, {snake_case_field})"
-            elif _is_handle_type(_decay_eos_type(field_type), field):
-                ret += f"_EXPAND_TO_GODOT_VAL_HANDLER({_convert_handle_class_name(_decay_eos_type(field_type))}, data->{field})"
-                signal_bind_args += f"_MAKE_PROP_INFO({_convert_handle_class_name(_decay_eos_type(field_type))}, {snake_case_field})"
-            elif _is_arr_field(field_type, field):
-                ret += f"_EXPAND_TO_GODOT_VAL_ARR({remap_type(field_type)}, data->{field}, data->{_find_count_field(field, fields.keys())})"
-                signal_bind_args += f'PropertyInfo(Variant({remap_type(field_type)}()).get_type(), "{snake_case_field}")'
-            else:
-                ret += f"_EXPAND_TO_GODOT_VAL({remap_type(field_type)}, data->{field})"
-                signal_bind_args += f'PropertyInfo(Variant({remap_type(field_type)}()).get_type(), "{snake_case_field}")'
+            fmt_args: dict[str, str] = {
+                "field": field,
+                "snake_field": snake_case_field,
+                "count_field": count_field,
+            }
+            # 仅计算对应格式所需的参数
+            if kind in ["struct_arr", "struct"]:
+                decayed_type: str = _decay_eos_type(field_type)
+                fmt_args["decayed_type"] = remap_type(decayed_type)
+                fmt_args["struct_class"] = __convert_to_struct_class(decayed_type)
+            elif kind in ["handle_arr", "handle"]:
+                fmt_args["handle_class"] = _convert_handle_class_name(_decay_eos_type(field_type))
+            elif kind != "socket_id":
+                fmt_args["type"] = remap_type(field_type)
+                if kind in ["enum", "enum_flags"]:
+                    fmt_args["enum_owner"] = _get_enum_owned_interface(field_type)
+                    fmt_args["enum_type"] = _convert_enum_type(field_type)
+            expand_args.append(_EXPAND_FMTS[kind].format(**fmt_args))
+            signal_bind_args.append(_BIND_FMTS[kind].format(**fmt_args))
 
             expanded_args_doc[snake_case_field] = fields[field]["doc"]
-        ret += ")"
 
-        # if len(signal_bind_args):
-        #     signal_bind_args = ", " + signal_bind_args
-        r_bind_signal_lines.append(f'\tADD_SIGNAL(MethodInfo("{signal_name}"{signal_bind_args}));')
+        r_bind_signal_lines.append(f'\tADD_SIGNAL(MethodInfo({", ".join(signal_bind_args)}));')
 
         additional_doc: list[str] = []
         if len(method) and signal_name.startswith("on_"):
             additional_doc.append(f"Callback of [method {method}].\n")
         _insert_doc_signal(handle, signal_name, infos["doc"], expanded_args_doc, additional_doc)
-        return ret
+        return ",\n\t\t\t".join(expand_args) + ")"
 
 
+@lru_cache(maxsize=None)
 def __get_api_latest_macro(struct_type: str) -> str:
-    #
-    if (struct_type.upper() + "_API_LATEST") in api_latest_macros:
-        return struct_type.upper() + "_API_LATEST"
-    #
-    if (struct_type.removesuffix("Options").upper() + "_API_LATEST") in api_latest_macros:
-        return struct_type.removesuffix("Options").upper() + "_API_LATEST"
-    #
-    if (struct_type.upper() + "OPTIONS_API_LATEST") in api_latest_macros:
-        return struct_type.upper() + "OPTIONS_API_LATEST"
-    #
-    if (struct_type.upper() + "_OPTIONS_API_LATEST") in api_latest_macros:
-        return struct_type.upper() + "_OPTIONS_API_LATEST"
+    struct_type_upper: str = struct_type.upper()
+    for macro in [
+        struct_type_upper + "_API_LATEST",
+        struct_type.removesuffix("Options").upper() + "_API_LATEST",
+        struct_type_upper + "OPTIONS_API_LATEST",
+        struct_type_upper + "_OPTIONS_API_LATEST",
+    ]:
+        if macro in api_latest_macros:
+            return macro
     # 特殊
     if struct_type in ["EOS_UserInfo", "EOS_UserInfo_CopyUserInfoOptions"]:
         return "EOS_USERINFO_COPYUSERINFO_API_LATEST"
@@ -2114,34 +2175,36 @@ def __get_api_latest_macro(struct_type: str) -> str:
     exit()
 
 
+# TODO: 能否不硬编码
+# TODO: 不含 eos common, 需要特殊处理
+_STR_MAX_LEN_MACROS: dict[str, str] = {
+    "EOS_Connect_GetProductUserIdMapping": "EOS_CONNECT_EXTERNAL_ACCOUNT_ID_MAX_LENGTH",
+    "EOS_Ecom_CopyLastRedeemedEntitlementByIndex": "EOS_ECOM_ENTITLEMENTID_MAX_LENGTH",
+    "EOS_Ecom_Transaction_GetTransactionId": "EOS_ECOM_TRANSACTIONID_MAXIMUM_LENGTH",
+    "EOS_Lobby_GetInviteIdByIndex": "EOS_LOBBY_INVITEID_MAX_LENGTH",
+    "EOS_Lobby_GetRTCRoomName": "256",  # ?
+    "EOS_Lobby_GetConnectString": "EOS_LOBBY_GETCONNECTSTRING_BUFFER_SIZE",
+    "EOS_Lobby_ParseConnectString": "EOS_LOBBY_PARSECONNECTSTRING_BUFFER_SIZE",
+    "EOS_PlayerDataStorageFileTransferRequest_GetFilename": "EOS_PLAYERDATASTORAGE_FILENAME_MAX_LENGTH_BYTES",
+    "EOS_Presence_GetJoinInfo": "EOS_PRESENCEMODIFICATION_JOININFO_MAX_LENGTH",
+    "EOS_Platform_GetActiveCountryCode": "EOS_COUNTRYCODE_MAX_LENGTH",
+    "EOS_Platform_GetActiveLocaleCode": "EOS_LOCALECODE_MAX_LENGTH",
+    "EOS_Platform_GetOverrideCountryCode": "EOS_COUNTRYCODE_MAX_LENGTH",
+    "EOS_Platform_GetOverrideLocaleCode": "EOS_LOCALECODE_MAX_LENGTH",
+    "EOS_Sessions_GetInviteIdByIndex": "EOS_LOBBY_INVITEID_MAX_LENGTH",
+    "EOS_TitleStorageFileTransferRequest_GetFilename": "EOS_TITLESTORAGE_FILENAME_MAX_LENGTH_BYTES",
+    # 以下可能需要特殊处理
+    "EOS_EpicAccountId_ToString": "EOS_EPICACCOUNTID_MAX_LENGTH",
+    "EOS_ProductUserId_ToString": "EOS_PRODUCTUSERID_MAX_LENGTH",
+    "EOS_ContinuanceToken_ToString": "256",  # 需要调用一次从 InOut 参数获取需要的大小
+}
+
+
 def __get_str_result_max_length_macro(method_name: str) -> str:
-    # TODO: 能否不硬编码
-    # TODO: 不含 eos common, 需要特殊处理
-    map = {
-        "EOS_Connect_GetProductUserIdMapping": "EOS_CONNECT_EXTERNAL_ACCOUNT_ID_MAX_LENGTH",
-        "EOS_Ecom_CopyLastRedeemedEntitlementByIndex": "EOS_ECOM_ENTITLEMENTID_MAX_LENGTH",
-        "EOS_Ecom_Transaction_GetTransactionId": "EOS_ECOM_TRANSACTIONID_MAXIMUM_LENGTH",
-        "EOS_Lobby_GetInviteIdByIndex": "EOS_LOBBY_INVITEID_MAX_LENGTH",
-        "EOS_Lobby_GetRTCRoomName": "256",  # ?
-        "EOS_Lobby_GetConnectString": "EOS_LOBBY_GETCONNECTSTRING_BUFFER_SIZE",
-        "EOS_Lobby_ParseConnectString": "EOS_LOBBY_PARSECONNECTSTRING_BUFFER_SIZE",
-        "EOS_PlayerDataStorageFileTransferRequest_GetFilename": "EOS_PLAYERDATASTORAGE_FILENAME_MAX_LENGTH_BYTES",
-        "EOS_Presence_GetJoinInfo": "EOS_PRESENCEMODIFICATION_JOININFO_MAX_LENGTH",
-        "EOS_Platform_GetActiveCountryCode": "EOS_COUNTRYCODE_MAX_LENGTH",
-        "EOS_Platform_GetActiveLocaleCode": "EOS_LOCALECODE_MAX_LENGTH",
-        "EOS_Platform_GetOverrideCountryCode": "EOS_COUNTRYCODE_MAX_LENGTH",
-        "EOS_Platform_GetOverrideLocaleCode": "EOS_LOCALECODE_MAX_LENGTH",
-        "EOS_Sessions_GetInviteIdByIndex": "EOS_LOBBY_INVITEID_MAX_LENGTH",
-        "EOS_TitleStorageFileTransferRequest_GetFilename": "EOS_TITLESTORAGE_FILENAME_MAX_LENGTH_BYTES",
-        # 以下可能需要特殊处理
-        "EOS_EpicAccountId_ToString": "EOS_EPICACCOUNTID_MAX_LENGTH",
-        "EOS_ProductUserId_ToString": "EOS_PRODUCTUSERID_MAX_LENGTH",
-        "EOS_ContinuanceToken_ToString": "256",  # 需要调用一次从 InOut 参数获取需要的大小
-    }
-    if not method_name in map:
+    if not method_name in _STR_MAX_LEN_MACROS:
         print("ERR has not MAX_LENGTH macros: ", method_name)
         exit()
-    return map[method_name]
+    return _STR_MAX_LEN_MACROS[method_name]
 
 
 def __get_str_arr_element_type(str_arr_type: str) -> str:
@@ -2176,23 +2239,8 @@ def __expand_input_struct(
 
     fields: dict[str, str] = __get_struct_fields(decayed_type)
 
-    ## 检出不需要成为参数的字段
-    count_fields: list[str] = []
-    variant_union_type_fields: list[str] = []
-    for field in fields.keys():
-        if is_deprecated_field(field):
-            continue
-
-        field_type = fields[field]["type"]
-        # 检出count字段
-        if _is_arr_field(field_type, field) or _is_internal_struct_arr_field(field_type, field):
-            count_fields.append(_find_count_field(field, fields.keys()))
-
-        # 检出Variant式的联合体类型字段
-        if _is_variant_union_type(field_type, field):
-            for f in fields.keys():
-                if f == field + "Type":
-                    variant_union_type_fields.append(f)
+    ## 不需要成为参数的字段
+    skip_fields: frozenset[str] = __find_count_and_variant_type_fields_in_struct(decayed_type)
     ##
     for field in fields:
         field_type: str = fields[field]["type"]
@@ -2204,7 +2252,7 @@ def __expand_input_struct(
             macro = __get_api_latest_macro(decayed_type)
             r_prepare_lines.append(f"\t{arg_name}.ApiVersion = {macro};")
             continue
-        elif is_deprecated_field(field) or field in count_fields or field in variant_union_type_fields:
+        elif field in skip_fields:
             # 需要跳过的字段
             continue
 
@@ -2227,7 +2275,7 @@ def __expand_input_struct(
             r_declare_args.append(f"const PackedInt32Array &p_{snake_field}")
             r_prepare_lines.append(f"\tLocalVector<int32_t> _shadow_{snake_field};")
             r_prepare_lines.append(f"\t_packed_int32_to_audio_frames(p_{snake_field}, _shadow_{snake_field});")
-            r_prepare_lines.append(f"\t{arg_name}.{_find_count_field(field, fields.keys())} = _shadow_{snake_field}.size();")
+            r_prepare_lines.append(f"\t{arg_name}.{_find_count_field(field, fields)} = _shadow_{snake_field}.size();")
             r_prepare_lines.append(f"\t{options_field} = _shadow_{snake_field}.ptr();")
         elif _is_socket_id_type(decay_field_type, field):
             r_declare_args.append(f"const String &p_{snake_field}")
@@ -2251,7 +2299,7 @@ def __expand_input_struct(
             r_prepare_lines.append(f"\t{options_field} = to_eos_type<const CharString &, decltype({options_field})>(utf8_{snake_field});")
         elif _is_str_arr_type(field_type, field):
             r_declare_args.append(f"const PackedStringArray &p_{snake_field}")
-            option_count_field = f"{arg_name}.{_find_count_field(field, fields.keys())}"
+            option_count_field = f"{arg_name}.{_find_count_field(field, fields)}"
             element_type: str = __get_str_arr_element_type(field_type)
             r_prepare_lines.append(f"\tLocalVector<{element_type}> _shadow_{snake_field};")
             r_prepare_lines.append(f"\t_TO_EOS_STR_ARR_FROM_PACKED_STRING_ARR({options_field}, p_{snake_field}, _shadow_{snake_field}, {option_count_field});")
@@ -2263,18 +2311,18 @@ def __expand_input_struct(
             r_prepare_lines.append(f"\t_TO_EOS_FIELD_REQUESTED_CHANNEL({options_field}, p_{snake_field});")
             r_bind_def_vals.append("DEFVAL(-1)")
         elif field_type.startswith("Union"):
-            r_declare_args.append(f"const {remap_type(_decay_eos_type(field_type), field)} &p_{snake_field}")
+            r_declare_args.append(f"const {remap_type(decay_field_type, field)} &p_{snake_field}")
             if _is_variant_union_type(field_type, field):
                 r_prepare_lines.append(f"\t_TO_EOS_FIELD_VARIANT_UNION({options_field}, p_{snake_field});")
             else:
                 r_prepare_lines.append(f"\t_TO_EOS_FIELD_METRICS_ACCOUNT_ID_UNION({options_field}, p_{snake_field});")
         elif _is_handle_arr_type(field_type, field):
             r_declare_args.append(f"const TypedArray<{_convert_handle_class_name(decay_field_type)}> &p_{snake_field}")
-            option_count_field = f"{arg_name}.{_find_count_field(field, fields.keys())}"
+            option_count_field = f"{arg_name}.{_find_count_field(field, fields)}"
             r_prepare_lines.append(f"\tLocalVector<{decay_field_type}> _shadow_{snake_field};")
             r_prepare_lines.append(f"\t_TO_EOS_FIELD_HANDLER_ARR({options_field}, p_{snake_field}, _shadow_{snake_field}, {option_count_field});")
         elif _is_handle_type(decay_field_type, field):
-            r_declare_args.append(f"const class {remap_type(_decay_eos_type(field_type), field)} &p_{snake_field}")
+            r_declare_args.append(f"const class {remap_type(decay_field_type, field)} &p_{snake_field}")
             if len(invalid_arg_return_value):
                 r_prepare_lines.append(f"\tERR_FAIL_NULL_V(p_{snake_field}, {invalid_arg_return_value});")
             else:
@@ -2286,12 +2334,12 @@ def __expand_input_struct(
             print("ERR:", arg_type)
             _print_stack_and_exit()
         elif _is_internal_struct_arr_field(field_type, field):
-            r_declare_args.append(f"const TypedArray<{__convert_to_struct_class(_decay_eos_type(field_type))}> &p_{snake_field}")
-            option_count_field = f"{arg_name}.{_find_count_field(field, fields.keys())}"
-            r_prepare_lines.append(f"\tLocalVector<{_decay_eos_type(field_type)}> _shadow_{snake_field};")
+            r_declare_args.append(f"const TypedArray<{__convert_to_struct_class(decay_field_type)}> &p_{snake_field}")
+            option_count_field = f"{arg_name}.{_find_count_field(field, fields)}"
+            r_prepare_lines.append(f"\tLocalVector<{decay_field_type}> _shadow_{snake_field};")
             r_prepare_lines.append(f"\t_TO_EOS_FIELD_STRUCT_ARR({options_field}, p_{snake_field}, _shadow_{snake_field}, {option_count_field});")
         elif _is_internal_struct_field(field_type, field):
-            r_declare_args.append(f"const {remap_type(_decay_eos_type(field_type), field, True)} &p_{snake_field}")
+            r_declare_args.append(f"const {remap_type(decay_field_type, field, True)} &p_{snake_field}")
             if len(invalid_arg_return_value):
                 r_prepare_lines.append(f"\tERR_FAIL_NULL_V(p_{snake_field}, {invalid_arg_return_value});")
             else:
@@ -2301,11 +2349,11 @@ def __expand_input_struct(
 
         elif _is_arr_field(field_type, field):
             r_declare_args.append(f"const {remap_type(field_type, field)} &p_{snake_field}")
-            option_count_field = f"{arg_name}.{_find_count_field(field, fields.keys())}"
+            option_count_field = f"{arg_name}.{_find_count_field(field, fields)}"
             r_prepare_lines.append(f"\t_TO_EOS_FIELD_ARR({options_field}, p_{snake_field}, {option_count_field});")
         elif _is_struct_ptr(field_type):
             r_declare_args.append(f"gd_arg_t<{remap_type(field_type, field)}> p_{snake_field}")
-            r_prepare_lines.append(f"\t{field_type} shadow_{snake_field} = to_eos_type<decltype(p_{snake_field}), {_decay_eos_type(field_type)}>(p_{snake_field});")
+            r_prepare_lines.append(f"\t{field_type} shadow_{snake_field} = to_eos_type<decltype(p_{snake_field}), {decay_field_type}>(p_{snake_field});")
             r_prepare_lines.append(f"\t{options_field} = &shadow_{snake_field};")
         elif _is_enum_flags_type(field_type):
             r_declare_args.append(f"BitField<{remap_type(field_type, field)}> p_{snake_field}")
@@ -2529,12 +2577,32 @@ def __convert_method_name(method_name: str, handle_type: str = "") -> str:
         return to_snake_case(candidate_method_name).removeprefix("e_")  # Hack, 去除枚举前缀
 
 
+# 调用方法的语句, 调用类别 -> 行格式
+_CALL_FMTS: dict[str, tuple[str, ...]] = {
+    "handle": ("\tauto return_handle = {method_name}({call_args});",),
+    "result": ("\tEOS_EResult result_code = {method_name}({call_args});", "\tEOS::_set_last_result_code(result_code);"),
+    "no_ret": ("\t{method_name}({call_args});",),
+    "ret": ("\tauto ret = {method_name}({call_args});",),
+}
+
+
+def _classify_method_call(is_handle_return: bool, eos_return_type: str, return_type: str, need_out_to_ret: bool) -> str:
+    if is_handle_return:
+        return "handle"
+    elif eos_return_type == "EOS_EResult":
+        return "result"
+    elif return_type == "void" or return_type == "Signal" or need_out_to_ret:
+        return "no_ret"
+    else:
+        return "ret"
+
+
 def _gen_method(
     handle_type: str,
     method_name: str,
     info: dict[str],
     r_declare_lines: list[str],
-    r_define_lines: list[str],
+    r_define_lines: deque[str],
     r_bind_lines: list[str],
 ):
     handle_klass = _convert_handle_class_name(handle_type)
@@ -2665,10 +2733,11 @@ def _gen_method(
             # Client Data, 必定配合回调使用
             next_decayed_type = _decay_eos_type(info["args"][i + 1]["type"])
             if (i + 1) < len(info["args"]) and __is_callback_type(next_decayed_type):
+                next_snake_name: str = to_snake_case(info["args"][i + 1]["name"])
                 if next_decayed_type == "EOS_PlayerDataStorage_OnWriteFileCompleteCallback":
                     write_cb = f'{options_input_identifier}->get_{to_snake_case("WriteFileDataCallback")}()'
                     progress_cb = f'{options_input_identifier}->get_{to_snake_case("FileTransferProgressCallback")}()'
-                    completion_cb = f'p_{to_snake_case(info["args"][i+1]["name"])}'
+                    completion_cb = f"p_{next_snake_name}"
 
                     prepare_lines.append(f"\t{return_type} ret; ret.instantiate();")
                     prepare_lines.append(f"\tauto transfer_data = MAKE_FILE_TRANSFER_DATA(ret, {write_cb}, {progress_cb}, {completion_cb});")
@@ -2677,7 +2746,7 @@ def _gen_method(
                 elif next_decayed_type in ["EOS_PlayerDataStorage_OnReadFileCompleteCallback", "EOS_TitleStorage_OnReadFileCompleteCallback"]:
                     read_cb = f'{options_input_identifier}->get_{to_snake_case("ReadFileDataCallback")}()'
                     progress_cb = f'{options_input_identifier}->get_{to_snake_case("FileTransferProgressCallback")}()'
-                    completion_cb = f'p_{to_snake_case(info["args"][i+1]["name"])}'
+                    completion_cb = f"p_{next_snake_name}"
 
                     prepare_lines.append(f"\t{return_type} ret; ret.instantiate();")
                     prepare_lines.append(f"\tauto transfer_data = MAKE_FILE_TRANSFER_DATA(ret, {read_cb}, {progress_cb}, {completion_cb});")
@@ -2686,10 +2755,10 @@ def _gen_method(
                 elif next_decayed_type == "EOS_IntegratedPlatform_OnUserPreLogoutCallback":
                     prepare_lines.append("\tstatic auto ClientData = _CallbackClientData(this, {});")
                     prepare_lines.append("\tClientData.handle_wrapper = this;")
-                    prepare_lines.append(f'\tClientData.callback = p_{to_snake_case(info["args"][i+1]["name"])};')
+                    prepare_lines.append(f"\tClientData.callback = p_{next_snake_name};")
                     call_args.append("&ClientData")
                 else:
-                    call_args.append(f'_MAKE_CALLBACK_CLIENT_DATA(p_{to_snake_case(info["args"][i+1]["name"])})')
+                    call_args.append(f"_MAKE_CALLBACK_CLIENT_DATA(p_{next_snake_name})")
             else:
                 call_args.append(f"_MAKE_CALLBACK_CLIENT_DATA()")
         elif assume_only_one_local_user and _is_local_user_id(name):
@@ -2735,7 +2804,7 @@ def _gen_method(
                 bind_def_vals,
                 expended_args_doc,
             )
-        elif name.startswith("Out") or name.startswith("InOut") or name.startswith("bOut"):
+        elif name.startswith(_OUT_ARG_PREFIXES):
             if len(remapped_return_type) == 0:
                 # Out 参数
                 converted_return_type: list[str] = []
@@ -2821,14 +2890,12 @@ def _gen_method(
     # ======= 声明 ===============
     r_declare_lines.append(f'\t{"static " if static else ""}{return_type} {snake_method_name}({", ".join(declare_args)});')
     # ======= 定义 ===============
-    for i in range(len(declare_args)):
-        # 移除默认值
-        declare_args[i] = declare_args[i].rsplit(" =", 1)[0]
-        # 移除前向声明
-        declare_args[i] = declare_args[i].replace(" class ", " ")
-    r_define_lines.append(f'{return_type.replace("class ", "")} {handle_klass}::{snake_method_name}({", ".join(declare_args)}) {{')
+    # 移除默认值与前向声明
+    define_args_text = ", ".join(arg.rsplit(" =", 1)[0].replace(" class ", " ") for arg in declare_args)
+    r_define_lines.append(f'{return_type.replace("class ", "")} {handle_klass}::{snake_method_name}({define_args_text}) {{')
     r_define_lines += prepare_lines
     # 调用
+    is_handle_return: bool = _is_handle_type(_decay_eos_type(info["return"]))
     if method_name == "EOS_Platform_Create":
         # 特殊处理
         r_define_lines.append(f'\tauto platform_handle = {method_name}({", ".join(call_args)});')
@@ -2879,21 +2946,16 @@ def _gen_method(
     elif method_name == "EOS_Logging_SetCallback":
         r_define_lines.append(f"\tEOS_EResult result_code = {method_name}(_EOS_LOGGING_CALLBACK());")
         r_define_lines.append(f"\tEOS::_set_last_result_code(result_code);")
-    elif _is_handle_type(_decay_eos_type(info["return"])):
-        r_define_lines.append(f'\tauto return_handle = {method_name}({", ".join(call_args)});')
-    elif info["return"] == "EOS_EResult":
-        r_define_lines.append(f'\tEOS_EResult result_code = {method_name}({", ".join(call_args)});')
-        r_define_lines.append(f"\tEOS::_set_last_result_code(result_code);")
-    elif return_type == "void" or return_type == "Signal" or need_out_to_ret:
-        r_define_lines.append(f'\t{method_name}({", ".join(call_args)});')
     else:
-        r_define_lines.append(f'\tauto ret = {method_name}({", ".join(call_args)});')
+        call_kind = _classify_method_call(is_handle_return, info["return"], return_type, need_out_to_ret)
+        call_args_text = ", ".join(call_args)
+        r_define_lines += [fmt.format(method_name=method_name, call_args=call_args_text) for fmt in _CALL_FMTS[call_kind]]
     # 后处理
     r_define_lines += after_call_lines
     # 返回
     if method_name == "EOS_Platform_Create":
         r_define_lines.append(f"\treturn EOS_EResult::EOS_Success;")
-    elif _is_handle_type(_decay_eos_type(info["return"])):
+    elif is_handle_return:
         if not for_file_transfer:
             r_define_lines.append(f"\t{return_type} ret;")
             r_define_lines.append(f"\tif(return_handle) {{ ret.instantiate(); ret->set_handle(return_handle);}}")
@@ -2934,67 +2996,55 @@ def _gen_method(
 
 
 def _get_EOS_EResult(r_file_lower2infos: list[str]):
-    f = open(os.path.join(sdk_include_dir, "eos_result.h"), "r")
-    lines: list[str] = f.readlines()
+    # 需要回溯提取文档，因此仍读取全部行
+    with open(os.path.join(sdk_include_dir, "eos_result.h"), "r", buffering=1 << 20) as f:
+        lines: list[str] = f.readlines()
 
-    r_file_lower2infos[_convert_to_interface_lower("eos_common.h")]["enums"]["EOS_EResult"] = {"doc": "", "members": []}
+    members: list[dict[str, str]] = []
+    r_file_lower2infos[_convert_to_interface_lower("eos_common.h")]["enums"]["EOS_EResult"] = {"doc": "", "members": members}
 
-    for i in range(len(lines)):
-        line: str = lines[i]
+    for i, line in enumerate(lines):
         if not line.startswith("EOS_RESULT_VALUE"):
             continue
-        r_file_lower2infos[_convert_to_interface_lower("eos_common.h")]["enums"]["EOS_EResult"]["members"].append(
+        members.append(
             {
                 "doc": _extract_doc(lines, i - 1),
-                "name": line.split("(", 1)[1].split(", ", 1)[0],
+                "name": line.partition("(")[2].partition(", ")[0],
             }
         )
 
-    f.close()
 
+# EOS_UI_KEY_XXX(Prefix, Name, ...) 宏，枚举成员名为 Prefix + Name
+_UI_KEY_RE = re.compile(r"EOS_UI_KEY_[^(]*\((?P<prefix>[^)]*?), (?P<name>[^)]*?)(?:, |\))")
 
-def _get_EOS_UI_EKeyCombination(r_file_lower2infos: list[str]):
-    f = open(os.path.join(sdk_include_dir, "eos_ui_keys.h"), "r")
-    lines: list[str] = f.readlines()
 
-    r_file_lower2infos[_convert_to_interface_lower("eos_ui_types.h")]["enums"]["EOS_UI_EKeyCombination"] = {"doc": "", "members": []}
+def _parse_ui_key_enum(r_file_lower2infos: list[str], file_name: str, enum_type: str):
+    # 需要回溯提取文档，因此仍读取全部行
+    with open(os.path.join(sdk_include_dir, file_name), "r", buffering=1 << 20) as f:
+        lines: list[str] = f.readlines()
 
-    for i in range(len(lines)):
-        line: str = lines[i]
-        if not line.startswith("EOS_UI_KEY_"):
+    members: list[dict[str, str]] = []
+    r_file_lower2infos[_convert_to_interface_lower("eos_ui_types.h")]["enums"][enum_type] = {"doc": "", "members": members}
+
+    for i, line in enumerate(lines):
+        m = _UI_KEY_RE.match(line)
+        if m is None:
             continue
 
-        splits = line.split("(", 1)[1].rsplit(")")[0].split(", ")
-        r_file_lower2infos[_convert_to_interface_lower("eos_ui_types.h")]["enums"]["EOS_UI_EKeyCombination"]["members"].append(
+        members.append(
             {
                 "doc": _extract_doc(lines, i - 1),
-                "name": splits[0] + splits[1],
+                "name": m["prefix"] + m["name"],
             }
         )
 
-    f.close()
-
-
-def _get_EOS_UI_EInputStateButtonFlags(r_file_lower2infos: list[str]):
-    f = open(os.path.join(sdk_include_dir, "eos_ui_buttons.h"), "r")
-    lines: list[str] = f.readlines()
 
-    r_file_lower2infos[_convert_to_interface_lower("eos_ui_types.h")]["enums"]["EOS_UI_EInputStateButtonFlags"] = {"doc": "", "members": []}
-
-    for i in range(len(lines)):
-        line: str = lines[i]
-        if not line.startswith("EOS_UI_KEY_"):
-            continue
+def _get_EOS_UI_EKeyCombination(r_file_lower2infos: list[str]):
+    _parse_ui_key_enum(r_file_lower2infos, "eos_ui_keys.h", "EOS_UI_EKeyCombination")
 
-        splits = line.split("(", 1)[1].rsplit(")")[0].split(", ")
-        r_file_lower2infos[_convert_to_interface_lower("eos_ui_types.h")]["enums"]["EOS_UI_EInputStateButtonFlags"]["members"].append(
-            {
-                "doc": _extract_doc(lines, i - 1),
-                "name": splits[0] + splits[1],
-            }
-        )
 
-    f.close()
+def _get_EOS_UI_EInputStateButtonFlags(r_file_lower2infos: list[str]):
+    _parse_ui_key_enum(r_file_lower2infos, "eos_ui_buttons.h", "EOS_UI_EInputStateButtonFlags")
 
 
 def _is_handle_arr_type(type: str, name: str) -> bool:
@@ -3019,10 +3069,12 @@ def _convert_enum_type(ori: str) -> str:
         return ori
 
 
+@lru_cache(maxsize=None)
 def _convert_enum_value(ori: str) -> str:
     return ori.removeprefix("EOS_")
 
 
+@lru_cache(maxsize=None)
 def _is_need_skip_struct(struct_type: str) -> bool:
     return (
         struct_type
@@ -3042,6 +3094,7 @@ def _is_need_skip_callback(callback_type: str) -> bool:
     return callback_type in ["EOS_IntegratedPlatform_OnUserPreLogoutCallback"]
 
 
+@lru_cache(maxsize=None)
 def _is_need_skip_method(method_name: str) -> bool:
     # TODO: Create , Release, GetInterface 均不需要
     return (
@@ -3070,6 +3123,7 @@ def _is_need_skip_method(method_name: str) -> bool:
     )  # 保留的API, 不能被用户调用
 
 
+@lru_cache(maxsize=None)
 def _is_need_skip_enum_type(ori_enum_type: str) -> bool:
     return ori_enum_type in []
 
@@ -3084,39 +3138,146 @@ def _is_need_skip_enum_value(ori_enum_type: str, enum_value: str) -> bool:
     return ori_enum_type in map and enum_value in map[ori_enum_type]
 
 
-def _get_enum_owned_interface(ori_enum_type: str) -> str:
+def _index_enum_owners() -> None:
+    # 单次遍历 generate_infos 构建枚举所属索引，按遍历顺序先到先得
+    enum2owner_class.clear()
     for infos in generate_infos.values():
-        if ori_enum_type in infos["enums"]:
-            print("ERROR UNSUPPORTED ENUM:", ori_enum_type)
-            _print_stack_and_exit()
+        for e in infos["enums"]:
+            enum2owner_class.setdefault(e, None)
         for h in infos["handles"]:
-            if ori_enum_type in infos["handles"][h]["enums"]:
-                return _convert_handle_class_name(h)
-    print("ERROR UNSUPPORTED ENUM !:", ori_enum_type)
-    _print_stack_and_exit()
+            handle_class = _convert_handle_class_name(h)
+            for e in infos["handles"][h]["enums"]:
+                enum2owner_class.setdefault(e, handle_class)
+
+
+def _get_enum_owned_interface(ori_enum_type: str) -> str:
+    # 依赖 _index_enum_owners() 构建的索引，仅在解析完成后调用
+    if not ori_enum_type in enum2owner_class:
+        print("ERROR UNSUPPORTED ENUM !:", ori_enum_type)
+        _print_stack_and_exit()
+    owner = enum2owner_class[ori_enum_type]
+    if owner is None:
+        print("ERROR UNSUPPORTED ENUM:", ori_enum_type)
+        _print_stack_and_exit()
+    return owner
 
 
 def _is_reserved_field(field: str, type: str) -> bool:
     return field == "Reserved" and type == "void*"
 
 
+# 除 "_DEPRECATED" 后缀以外，需要视为弃用而跳过的字段
+_DEPRECATED_FIELDS: frozenset[str] = frozenset(
+    [
+        # "Reserved",  # SDK要求保留
+        "SystemSpecificOptions",  # 内部处理
+        "SystemAuthCredentialsOptions",  # 暂不支持的字段，下载的sdk里没有 (System)/eos_(system).h
+        "SystemMemoryMonitorReport",  # 暂不支持的字段，下载的sdk里没有 eos_<platform>_ui.h 文件
+        "PlatformSpecificData",  # 暂不支持的字段，下载的sdk里没有 eos_<platform>_ui.h 文件
+    ]
+)
+
+
+@lru_cache(maxsize=None)
 def is_deprecated_field(field: str) -> bool:
-    return (
-        field.endswith("_DEPRECATED")
-        or field
-        in [
-            # "Reserved",  # SDK要求保留
-            "SystemSpecificOptions",  # 内部处理
-        ]
-        or field
-        in [
-            "SystemAuthCredentialsOptions",  # 暂不支持的字段，下载的sdk里没有 (System)/eos_(system).h
-            "SystemMemoryMonitorReport",  # 暂不支持的字段，下载的sdk里没有 eos_<platform>_ui.h 文件
-            "PlatformSpecificData",  # 暂不支持的字段，下载的sdk里没有 eos_<platform>_ui.h 文件
-        ]
-    )
+    return field in _DEPRECATED_FIELDS or field.endswith("_DEPRECATED")
+
+
+# remap_type 使用的映射表
+# 联合体字段 -> Godot 类型
+_UNION_FIELD_REMAP: dict[str, str] = {
+    "ParamValue": "Variant",
+    "Value": "Variant",
+    "AccountId": "String",
+}
 
+# 尚未处理的类型
+_TODO_REMAP_TYPES: dict[str, list[str]] = {
+    #
+    "EOS_PlayerDataStorage_OnReadFileDataCallback": ["ReadFileDataCallback"],
+    "EOS_PlayerDataStorage_OnFileTransferProgressCallback": ["FileTransferProgressCallback"],
+    "EOS_PlayerDataStorage_OnWriteFileDataCallback": ["WriteFileDataCallback"],
+    "EOS_TitleStorage_OnReadFileDataCallback": ["ReadFileDataCallback"],
+    "EOS_TitleStorage_OnFileTransferProgressCallback": ["FileTransferProgressCallback"],
+    # Arr
+    "const EOS_Stats_IngestData*": ["Stats"],
+    "const EOS_PresenceModification_DataRecordId*": ["Records"],
+    "const EOS_Presence_DataRecord*": ["Records"],
+    "const EOS_Leaderboards_UserScoresQueryStatInfo*": ["StatInfo"],
+    "const EOS_Ecom_CheckoutEntry*": ["Entries"],
+    "const EOS_AntiCheatCommon_RegisterEventParamDef*": ["ParamDefs"],
+    "const EOS_AntiCheatCommon_LogEventParamPair*": ["Params"],
+}
 
+# EOS 类型 -> Godot 类型
+_SIMPLE_REMAP: dict[str, str] = {
+    "void": "void",
+    "uint8_t": "uint8_t",
+    "int64_t": "int64_t",
+    "int32_t": "int32_t",
+    "uint16_t": "uint16_t",
+    "uint32_t": "uint32_t",
+    "uint64_t": "uint64_t",
+    "EOS_UI_EventId": "uint64_t",
+    "EOS_Bool": "bool",
+    "float": "float",
+    "EOS_LobbyId": "String",
+    "const EOS_LobbyId": "String",
+    "const char*": "String",
+    "EOS_Ecom_SandboxId": "String",
+    "const EOS_Ecom_CatalogItemId*": "PackedStringArray",
+    ## Options 新增
+    "EOS_AntiCheatCommon_Vec3f*": "Vector3",
+    "EOS_AntiCheatCommon_Quat*": "Quaternion",
+    "const char**": "PackedStringArray",
+    "EOS_Ecom_CatalogOfferId": "String",
+    "EOS_Ecom_EntitlementId": "String",
+    "EOS_Ecom_CatalogItemId": "String",
+    "EOS_Ecom_EntitlementName": "String",
+    "EOS_Ecom_EntitlementId*": "PackedStringArray",
+    "EOS_Ecom_CatalogItemId*": "PackedStringArray",
+    "EOS_Ecom_SandboxId*": "PackedStringArray",
+    "const char* const*": "PackedStringArray",
+    "EOS_Ecom_EntitlementName*": "PackedStringArray",
+    "EOS_OnlinePlatformType": "uint32_t",
+    "EOS_IntegratedPlatformType": "String",
+    "Union{EOS_AntiCheatCommon_ClientHandle : ClientHandle, const char* : String, uint32_t : UInt32, in, EOS_AntiCheatCommon_Vec3f : Vec3f, EOS_AntiCheatCommon_Quat : Quat}": "Variant",
+    "Union{int64_t : AsInt64, double : AsDouble, EOS_Bool : AsBool, const char* : AsUtf8}": "Variant",
+    "Union{EOS_EpicAccountId : Epic, const char* : External}": "String",
+    # 纯句柄
+    "EOS_AntiCheatCommon_ClientHandle": "handle_int_t<EOS_AntiCheatCommon_ClientHandle>",
+    #
+}
+
+# EOS 类型 -> {字段: Godot 类型}，未列出的字段使用 Variant
+_CONDITION_REMAP: dict[str, dict[str, str]] = {
+    "void*": {"ClientData": "Variant"},
+    "const void*": {
+        "DataChunk": "PackedByteArray",
+        "MessageData": "PackedByteArray",
+        "Data": "PackedByteArray",
+        # Options 新增
+        "SystemSpecificOptions": "Variant",  # 暂不支持
+        "PlatformSpecificData": "Variant",  # 暂不支持
+        "InitOptions": "Ref<class EOSIntegratedPlatform_Steam_Options>",  # 暂不支持
+        "SystemMemoryMonitorReport": "Variant",  # 暂不支持
+    },
+    "char": {
+        "SocketName[EOS_P2P_SOCKETID_SOCKETNAME_SIZE]": "String",
+    },
+    "const uint8_t*": {
+        "RequestedChannel": "int16_t",  # 可选字段，-1 将转为空指针
+    },
+    "int16_t*": {"Frame": "PackedInt32Array"},
+    "const uint32_t*": {"AllowedPlatformIds": "PackedInt32Array"},  # 平台ID，虽然是uint32_t但可行的值在int32_t的正值范围内
+    # 弃用的
+    "const EOS_Auth_AccountFeatureRestrictedInfo*": {
+        "AccountFeatureRestrictedInfo_DEPRECATED": "Dictionary",
+    },
+}
+
+
+@lru_cache(maxsize=None)
 def remap_type(type: str, field: str = "", forward_declare: bool = False) -> str:
     if _is_enum_type(type):
         # 枚举类型原样返回
@@ -3139,99 +3300,12 @@ def remap_type(type: str, field: str = "", forward_declare: bool = False) -> str
         return "Callable"
 
     if type.startswith("Union") and len(field):
-        union_field_map = {
-            "ParamValue": "Variant",
-            "Value": "Variant",
-            "AccountId": "String",
-        }
-        return union_field_map[field]
+        return _UNION_FIELD_REMAP[field]
 
-    todo_types = {
-        #
-        "EOS_PlayerDataStorage_OnReadFileDataCallback": ["ReadFileDataCallback"],
-        "EOS_PlayerDataStorage_OnFileTransferProgressCallback": ["FileTransferProgressCallback"],
-        "EOS_PlayerDataStorage_OnWriteFileDataCallback": ["WriteFileDataCallback"],
-        "EOS_TitleStorage_OnReadFileDataCallback": ["ReadFileDataCallback"],
-        "EOS_TitleStorage_OnFileTransferProgressCallback": ["FileTransferProgressCallback"],
-        # Arr
-        "const EOS_Stats_IngestData*": ["Stats"],
-        "const EOS_PresenceModification_DataRecordId*": ["Records"],
-        "const EOS_Presence_DataRecord*": ["Records"],
-        "const EOS_Leaderboards_UserScoresQueryStatInfo*": ["StatInfo"],
-        "const EOS_Ecom_CheckoutEntry*": ["Entries"],
-        "const EOS_AntiCheatCommon_RegisterEventParamDef*": ["ParamDefs"],
-        "const EOS_AntiCheatCommon_LogEventParamPair*": ["Params"],
-    }
-
-    simple_remap = {
-        "void": "void",
-        "uint8_t": "uint8_t",
-        "int64_t": "int64_t",
-        "int32_t": "int32_t",
-        "uint16_t": "uint16_t",
-        "uint32_t": "uint32_t",
-        "uint64_t": "uint64_t",
-        "EOS_UI_EventId": "uint64_t",
-        "EOS_Bool": "bool",
-        "float": "float",
-        "EOS_LobbyId": "String",
-        "const EOS_LobbyId": "String",
-        "const char*": "String",
-        "EOS_Ecom_SandboxId": "String",
-        "const EOS_Ecom_CatalogItemId*": "PackedStringArray",
-        ## Options 新增
-        "EOS_AntiCheatCommon_Vec3f*": "Vector3",
-        "EOS_AntiCheatCommon_Quat*": "Quaternion",
-        "const char**": "PackedStringArray",
-        "EOS_Ecom_CatalogOfferId": "String",
-        "EOS_Ecom_EntitlementId": "String",
-        "EOS_Ecom_CatalogItemId": "String",
-        "EOS_Ecom_EntitlementName": "String",
-        "EOS_Ecom_EntitlementId*": "PackedStringArray",
-        "EOS_Ecom_CatalogItemId*": "PackedStringArray",
-        "EOS_Ecom_SandboxId*": "PackedStringArray",
-        "const char* const*": "PackedStringArray",
-        "EOS_Ecom_EntitlementName*": "PackedStringArray",
-        "EOS_OnlinePlatformType": "uint32_t",
-        "EOS_IntegratedPlatformType": "String",
-        "Union{EOS_AntiCheatCommon_ClientHandle : ClientHandle, const char* : String, uint32_t : UInt32, in, EOS_AntiCheatCommon_Vec3f : Vec3f, EOS_AntiCheatCommon_Quat : Quat}": "Variant",
-        "Union{int64_t : AsInt64, double : AsDouble, EOS_Bool : AsBool, const char* : AsUtf8}": "Variant",
-        "Union{EOS_EpicAccountId : Epic, const char* : External}": "String",
-        # 纯句柄
-        "EOS_AntiCheatCommon_ClientHandle": "handle_int_t<EOS_AntiCheatCommon_ClientHandle>",
-        #
-    }
-
-    condition_remap = {
-        "void*": {"ClientData": "Variant"},
-        "const void*": {
-            "DataChunk": "PackedByteArray",
-            "MessageData": "PackedByteArray",
-            "Data": "PackedByteArray",
-            # Options 新增
-            "SystemSpecificOptions": "Variant",  # 暂不支持
-            "PlatformSpecificData": "Variant",  # 暂不支持
-            "InitOptions": "Ref<class EOSIntegratedPlatform_Steam_Options>",  # 暂不支持
-            "SystemMemoryMonitorReport": "Variant",  # 暂不支持
-        },
-        "char": {
-            "SocketName[EOS_P2P_SOCKETID_SOCKETNAME_SIZE]": "String",
-        },
-        "const uint8_t*": {
-            "RequestedChannel": "int16_t",  # 可选字段，-1 将转为空指针
-        },
-        "int16_t*": {"Frame": "PackedInt32Array"},
-        "const uint32_t*": {"AllowedPlatformIds": "PackedInt32Array"},  # 平台ID，虽然是uint32_t但可行的值在int32_t的正值范围内
-        # 弃用的
-        "const EOS_Auth_AccountFeatureRestrictedInfo*": {
-            "AccountFeatureRestrictedInfo_DEPRECATED": "Dictionary",
-        },
-    }
+    if type in _CONDITION_REMAP:
+        return _CONDITION_REMAP[type].get(field, "Variant")
 
-    if type in condition_remap.keys():
-        return condition_remap[type].get(field, "Variant")
-
-    return simple_remap.get(type, type)
+    return _SIMPLE_REMAP.get(type, type)
 
 
 def _is_expanded_struct(struct_type: str) -> bool:
@@ -3258,6 +3332,7 @@ def _is_expanded_struct(struct_type: str) -> bool:
     return _decay_eos_type(struct_type) in expanded_as_args_structs
 
 
+@lru_cache(maxsize=None)
 def to_snake_case(text: str) -> str:
     # SPECIAL: char SocketName[EOS_P2P_SOCKETID_SOCKETNAME_SIZE];
     text = text.split("[", 1)[0].removeprefix("b")
@@ -3278,82 +3353,79 @@ def to_snake_case(text: str) -> str:
     )
 
 
-def __is_arg_out_struct(struct_type: str) -> bool:
-    for infos in handles.values():
-        for method_info in infos["methods"].values():
-            for arg in method_info["args"]:
-                if _decay_eos_type(arg["type"]) == struct_type and arg["name"].startswith("Out"):
-                    return True
+def _index_struct_roles() -> None:
+    # 一次遍历所有方法、回调与结构体字段，建立结构体用途索引
+    for index in [arg_out_structs, input_structs, output_structs, struct2internal_owners, struct2internal_arr_owners]:
+        index.clear()
 
-    for method_info in unhandled_methods.values():
-        for arg in method_info["args"]:
-            if _decay_eos_type(arg["type"]) == struct_type and arg["name"].startswith("Out"):
-                print(f"Warning: ", struct_type)
-                return True
-    return False
-
-
-def __is_input_struct(struct_type: str) -> bool:
-    # Hack
-    if struct_type in ["EOS_IntegratedPlatform_Steam_Options"]:
-        return True
     for infos in handles.values():
         methods = infos["methods"]
         for method_name in methods:
-            if method_name.endswith("Release"):
-                # 不检查释放方法
-                continue
-
             method_info = methods[method_name]
+            output_structs[_decay_eos_type(method_info["return"])] = False
             for arg in method_info["args"]:
-                if _decay_eos_type(arg["type"]) == struct_type and not arg["name"].startswith("Out"):
-                    return True
+                decayed_type = _decay_eos_type(arg["type"])
+                if arg["name"].startswith("Out"):
+                    arg_out_structs[decayed_type] = False
+                elif not method_name.endswith("Release"):
+                    # 不检查释放方法
+                    input_structs[decayed_type] = False
+        for callback_info in infos["callbacks"].values():
+            for arg in callback_info["args"]:
+                output_structs[_decay_eos_type(arg["type"])] = False
 
     for method_name in unhandled_methods:
-        if method_name.endswith("Release"):
-            # 不检查释放方法
-            continue
-
         method_info = unhandled_methods[method_name]
+        output_structs.setdefault(_decay_eos_type(method_info["return"]), True)
         for arg in method_info["args"]:
-            if _decay_eos_type(arg["type"]) == struct_type and not arg["name"].startswith("Out"):
-                print(f"Warning: ", struct_type)
-                return True
-    return False
+            decayed_type = _decay_eos_type(arg["type"])
+            if arg["name"].startswith("Out"):
+                arg_out_structs.setdefault(decayed_type, True)
+            elif not method_name.endswith("Release"):
+                input_structs.setdefault(decayed_type, True)
+    for callback_info in unhandled_callbacks.values():
+        for arg in callback_info["args"]:
+            output_structs.setdefault(_decay_eos_type(arg["type"]), True)
 
+    for struct_name in structs:
+        for field, field_info in __get_struct_fields(struct_name).items():
+            field_type = field_info["type"]
+            owners_index = struct2internal_arr_owners if _is_internal_struct_arr_field(field_type, field) else struct2internal_owners
+            owners_index.setdefault(_decay_eos_type(field_type), {})[struct_name] = None
 
-def __is_output_struct(struct_type: str) -> bool:
-    for infos in handles.values():
-        for method_info in infos["methods"].values():
-            if _decay_eos_type(method_info["return"]) == struct_type:
-                return True
-        for callback_info in infos["callbacks"].values():
-            for arg in callback_info["args"]:
-                if _decay_eos_type(arg["type"]) == struct_type:
-                    return True
 
-    for method_info in unhandled_methods.values():
-        if _decay_eos_type(method_info["return"]) == struct_type:
-            print(f"Warning: ", struct_type)
-            return True
-    for callback_info in unhandled_callbacks.values():
-        for arg in callback_info["args"]:
-            if _decay_eos_type(arg["type"]) == struct_type:
-                print(f"Warning: ", struct_type)
-                return True
-    return False
+def __is_arg_out_struct(struct_type: str) -> bool:
+    if not struct_type in arg_out_structs:
+        return False
+    if arg_out_structs[struct_type]:
+        print(f"Warning: ", struct_type)
+    return True
+
+
+def __is_input_struct(struct_type: str) -> bool:
+    # Hack
+    if struct_type in ["EOS_IntegratedPlatform_Steam_Options"]:
+        return True
+    if not struct_type in input_structs:
+        return False
+    if input_structs[struct_type]:
+        print(f"Warning: ", struct_type)
+    return True
+
+
+def __is_output_struct(struct_type: str) -> bool:
+    if not struct_type in output_structs:
+        return False
+    if output_structs[struct_type]:
+        print(f"Warning: ", struct_type)
+    return True
 
 
 def __is_internal_struct(struct_type: str, r_owned_structs: list[str]) -> bool:
     if struct_type in ["EOS_IntegratedPlatform_Steam_Options"]:
         return False  # Hack
     r_owned_structs.clear()
-    for struct_name in structs:
-        fields = __get_struct_fields(struct_name)
-        for field in fields:
-            field_type = fields[field]["type"]
-            if not struct_name in r_owned_structs and not _is_internal_struct_arr_field(field_type, field) and _decay_eos_type(field_type) == struct_type:
-                r_owned_structs.append(struct_name)
+    r_owned_structs.extend(struct2internal_owners.get(struct_type, {}))
     return len(r_owned_structs) > 0
 
 
@@ -3361,12 +3433,7 @@ def __is_internal_struct_of_arr(struct_type: str, r_owned_structs: list[str]) ->
     r_owned_structs.clear()
     if not _decay_eos_type(struct_type) in structs:
         return False
-    for struct_name in structs:
-        fields = __get_struct_fields(struct_name)
-        for field in fields:
-            field_type = fields[field]["type"]
-            if not struct_name in r_owned_structs and _is_internal_struct_arr_field(field_type, field) and _decay_eos_type(field_type) == struct_type:
-                r_owned_structs.append(struct_name)
+    r_owned_structs.extend(struct2internal_arr_owners.get(struct_type, {}))
     return len(r_owned_structs) > 0
 
 
@@ -3411,40 +3478,43 @@ def __is_callback_output_only_struct(struct_type: str) -> bool:
 
 
 def _make_additional_method_requirements():
+    _index_struct_roles()
+
     # 第一遍只检查自身
     for struct_name in structs:
-        struct2additional_method_requirements[struct_name] = {
+        requirements: dict[str, bool] = {
             "set_from": False,
             "from": False,
             "set_to": False,
             "to": False,
         }
+        struct2additional_method_requirements[struct_name] = requirements
         #
         if __is_input_struct(struct_name):
-            struct2additional_method_requirements[struct_name]["set_to"] = True
-            struct2additional_method_requirements[struct_name]["to"] = True
+            requirements["set_to"] = True
+            requirements["to"] = True
         if __is_output_struct(struct_name):
-            struct2additional_method_requirements[struct_name]["set_from"] = True
-            struct2additional_method_requirements[struct_name]["from"] = True
+            requirements["set_from"] = True
+            requirements["from"] = True
         if __is_arg_out_struct(struct_name):
-            struct2additional_method_requirements[struct_name]["set_from"] = True
-    # 第二遍检查内部
+            requirements["set_from"] = True
+    # 第二遍检查内部，按顺序逐个合并，持有者的需求可能已在本遍中被更新
+    owned_structs: list[str] = []
     for struct_name in structs:
-        owned_structs: list[str] = []
+        requirements = struct2additional_method_requirements[struct_name]
         if __is_internal_struct(struct_name, owned_structs):
             for s in owned_structs:
-                for k in struct2additional_method_requirements[s]:
-                    if struct2additional_method_requirements[s][k]:
-                        struct2additional_method_requirements[struct_name][k] = True
+                for k, required in struct2additional_method_requirements[s].items():
+                    if required:
+                        requirements[k] = True
 
-        owned_structs.clear()
         if __is_internal_struct_of_arr(struct_name, owned_structs):
             for s in owned_structs:
                 if __is_input_struct(s):
-                    struct2additional_method_requirements[struct_name]["set_to"] = True  # 不需要 to 附带的实例字段
+                    requirements["set_to"] = True  # 不需要 to 附带的实例字段
                 if __is_output_struct(s) or __is_arg_out_struct(s):
-                    struct2additional_method_requirements[struct_name]["set_from"] = True
-                    struct2additional_method_requirements[struct_name]["from"] = True
+                    requirements["set_from"] = True
+                    requirements["from"] = True
 
     # 检出应该被展开为参数的结构体
     for struct_type in structs:
@@ -3483,16 +3553,40 @@ def _is_string_constant(val: str) -> bool:
     return val.startswith("(const char*)") or val.startswith('"')
 
 
-def _parse_file(interface_lower: str, fp: str, r_file_lower2infos: dict[str, dict]):
-    f = open(fp, "r")
-    lines = f.readlines()
-    f.close()
+# 头文件中各声明的匹配模式
+_HANDLE_RE = re.compile(r"typedef struct \w+\* (?P<name>\w+);")
+_ENUM_RE = re.compile(r"EOS_ENUM\((?P<name>[^,(]*)")
+_FUNC_RE = re.compile(r"EOS_DECLARE_FUNC\((?P<ret>[^)]*)\) (?P<name>[^(]*)\((?P<args>.*)\)")
+_CALLBACK_RE = re.compile(r"EOS_DECLARE_CALLBACK(?P<retvalue>_RETVALUE)?[^(]*\((?P<args>[^)]*)")
+_STRUCT_RE = re.compile(r"EOS_STRUCT\((?P<name>\w+)")
+# 结构体字段，取第一个 ";" 之前的内容并以最后一个空格分隔类型与字段名
+_FIELD_RE = re.compile(r"(?P<type>[^;]*) (?P<name>[^ ;]*)")
+# 结构体中非字段的行（注释、续行等）
+_NON_FIELD_LINE_PREFIXES: tuple[str, ...] = ("/", "*", " ")
+
+
+def _parse_file(interface_lower: str, fp: str, need_interface_doc: bool) -> dict:
+    # 单个文件的解析结果，由调用方合并到对应接口中
+    # need_interface_doc: 所属接口尚未提取到接口说明时才扫描（扫描会跳过说明所在的行）
+    ret: dict = {
+        "enums": {},
+        "methods": {},
+        "callbacks": {},
+        "structs": {},
+        "handles": {},
+        "constants": {},
+        "interface_doc": [],
+        "api_latest_macros": [],
+    }
+
+    with open(fp, "r", buffering=1 << 20) as f:
+        lines = f.readlines()
 
     i = 0
 
     while i < len(lines):
         line = lines[i]
-        if len(r_file_lower2infos[interface_lower]["interface_doc"]) <= 0:
+        if need_interface_doc and len(ret["interface_doc"]) <= 0:
             # 尝试提取接口说明(仅识别多行注释)
             if line.startswith("/**") and not line.strip().endswith("*/"):
                 is_interface_doc = False
@@ -3503,7 +3597,7 @@ def _parse_file(interface_lower: str, fp: str, r_file_lower2infos: dict[str, dic
                     if lines[j].startswith(" */"):
                         if is_interface_doc:
                             i = j + 1
-                            r_file_lower2infos[interface_lower]["interface_doc"] = _extract_doc(lines, j)
+                            ret["interface_doc"] = _extract_doc(lines, j)
                             break
 
                     if len(lines[j].strip()) == 0:
@@ -3519,34 +3613,37 @@ def _parse_file(interface_lower: str, fp: str, r_file_lower2infos: dict[str, dic
                         doc.append("\n")
                         doc.append(f"@see EOS_Platform_Get{interface_type}Interface\n")
                         i = j
-                        r_file_lower2infos[interface_lower]["interface_doc"] = doc
+                        ret["interface_doc"] = doc
                         break
 
-        # ApiVersion 宏
-        if line.startswith("#define EOS_") and "_API_LATEST" in line:
-            macro = line.split(" ", 2)[1]
-            api_latest_macros.append(macro)
-            i += 1
-            continue
-
-        # 常量宏
         if line.startswith("#define EOS_"):
+            # ApiVersion 宏
+            if "_API_LATEST" in line:
+                macro = line.split(" ", 2)[1]
+                ret["api_latest_macros"].append(macro)
+                i += 1
+                continue
+
+            # 常量宏
             text: str = line.strip().split(" ", 1)[1]
+            space_splits = text.split(" ", 1)
             splits: list[str] = []
-            if len(text.split(" ", 1)) > 1 and not "(" in text.split(" ", 1)[0]:
-                splits = text.split(" ", 1)
-            if len(text.split("\t", 1)) > 1 and not "(" in text.split(" ", 1)[0]:
-                splits = text.split("\t", 1)
+            if len(space_splits) > 1 and not "(" in space_splits[0]:
+                splits = space_splits
+            tab_splits = text.split("\t", 1)
+            if len(tab_splits) > 1 and not "(" in space_splits[0]:
+                splits = tab_splits
             if splits:
                 for j in range(len(splits)):
                     splits[j] = splits[j].strip()
                 if not _is_deprecated_constant(splits[0]) and not _is_need_skip_constant(splits[0]):
-                    r_file_lower2infos[interface_lower]["constants"][splits[0]] = {"doc": _extract_doc(lines, i - 1), "value": splits[1]}
+                    ret["constants"][splits[0]] = {"doc": _extract_doc(lines, i - 1), "value": splits[1]}
 
         # 句柄类型
-        if "typedef struct " in line:  #  and "Handle*" in line
-            handle_type = line.split("* ", 1)[1].split(";", 1)[0]
-            r_file_lower2infos[interface_lower]["handles"][handle_type] = {
+        m = _HANDLE_RE.search(line) if "typedef struct " in line else None
+        if m:
+            handle_type = m["name"]
+            ret["handles"][handle_type] = {
                 "doc": _extract_doc(lines, i - 1),
                 "methods": {},
                 "callbacks": {},
@@ -3557,32 +3654,35 @@ def _parse_file(interface_lower: str, fp: str, r_file_lower2infos: dict[str, dic
             continue
 
         # 枚举
-        if line.startswith("EOS_ENUM(") and not line.split("(")[0] in [
-            "EOS_ENUM_START",
-            "EOS_ENUM_END",
-            "EOS_ENUM_BOOLEAN_OPERATORS",
-        ]:
-            enum_type = line.split("(")[1].rsplit(",")[0]
+        m = _ENUM_RE.match(line)
+        if m:
+            enum_type = m["name"]
 
-            r_file_lower2infos[interface_lower]["enums"][enum_type] = {"doc": _extract_doc(lines, i - 1), "members": []}
+            members: list[dict] = []
+            ret["enums"][enum_type] = {"doc": _extract_doc(lines, i - 1), "members": members}
 
             i += 1
             while not lines[i].startswith(");"):
                 line = lines[i].lstrip("\t").rstrip("\n").rstrip(",")
-                if len(line) <= 0 or line.startswith(" ") or line.startswith("/"):
+                if len(line) <= 0 or line.startswith((" ", "/")):
                     i += 1
                     continue
 
-                splits = line.split(" = ")
-                r_file_lower2infos[interface_lower]["enums"][enum_type]["members"].append({"doc": _extract_doc(lines, i - 1), "name": splits[0]})
+                members.append({"doc": _extract_doc(lines, i - 1), "name": line.split(" = ", 1)[0]})
                 i += 1
 
             i += 1
             continue
 
         # 方法
-        elif line.startswith("EOS_DECLARE_FUNC"):
-            method_name = line.split(") ", 1)[1].split("(")[0]
+        if line.startswith("EOS_DECLARE_FUNC"):
+            m = _FUNC_RE.match(line)
+            if m is None:
+                # 无法识别的方法声明（如跨行声明），避免静默丢弃
+                print(f"ERROR: {fp}:{i}\n")
+                print(f"{lines[i]}")
+                _print_stack_and_exit()
+            method_name = m["name"]
             if method_name in [
                 # 弃用却包含在.h文件中的方法
                 "EOS_Achievements_AddNotifyAchievementsUnlocked"
@@ -3590,49 +3690,49 @@ def _parse_file(interface_lower: str, fp: str, r_file_lower2infos: dict[str, dic
                 i += 1
                 continue
 
+            method_args: list[dict[str, str]] = []
             method_info = {
                 "doc": _extract_doc(lines, i - 1),
-                "return": line.split("(", 1)[1].split(")")[0],
-                "args": [],
+                "return": m["ret"],
+                "args": method_args,
             }
-            args = line.split(" ", 1)[1].split("(", 1)[1].rsplit(")", 1)[0].split(", ")
-            for a in args:
-                if len(a) <= 0:
+            for a in m["args"].split(", "):
+                if len(a) <= 0 or a == "void":
                     continue
-                splits = a.rsplit(" ", 1)
-                if splits[0] == "void":
-                    continue
-                method_info["args"].append(
+                arg_type, _, arg_name = a.rpartition(" ")
+                method_args.append(
                     {
-                        "type": splits[0],
-                        "name": splits[1],
+                        "type": arg_type,
+                        "name": arg_name,
                     }
                 )
             #
-            r_file_lower2infos[interface_lower]["methods"][method_name] = method_info
+            ret["methods"][method_name] = method_info
 
             i += 1
             continue
 
         # 回调
-        elif line.startswith("EOS_DECLARE_CALLBACK"):
-            has_return = line.startswith("EOS_DECLARE_CALLBACK_RETVALUE")
+        m = _CALLBACK_RE.match(line)
+        if m:
+            has_return = m["retvalue"] is not None
 
-            args = line.split("(", 1)[1].rsplit(")")[0].split(", ")
+            args = m["args"].split(", ")
             callback_name = args[1] if has_return else args[0]
 
-            r_file_lower2infos[interface_lower]["callbacks"][callback_name] = {
+            callback_args: list[dict[str, str]] = []
+            ret["callbacks"][callback_name] = {
                 "doc": _extract_doc(lines, i - 1),
                 "return": args[0] if has_return else "",
-                "args": [],
+                "args": callback_args,
             }
 
-            for arg_idx in range((2 if has_return else 1), len(args)):
-                a = args[arg_idx]
-                r_file_lower2infos[interface_lower]["callbacks"][callback_name]["args"].append(
+            for a in args[(2 if has_return else 1) :]:
+                arg_type, _, arg_name = a.rpartition(" ")
+                callback_args.append(
                     {
-                        "type": a.rsplit(" ", 1)[0],
-                        "name": a.rsplit(" ", 1)[1],
+                        "type": arg_type,
+                        "name": arg_name,
                     }
                 )
 
@@ -3640,19 +3740,20 @@ def _parse_file(interface_lower: str, fp: str, r_file_lower2infos: dict[str, dic
             continue
 
         # 结构体
-        elif line.startswith("EOS_STRUCT"):
-            struct_name = line.lstrip("EOS_STRUCT").lstrip("(").rstrip("\n").rstrip(", (")
-            r_file_lower2infos[interface_lower]["structs"][struct_name] = {"doc": _extract_doc(lines, i - 1), "fields": {}}
+        m = _STRUCT_RE.match(line)
+        if m:
+            struct_name = m["name"]
+            fields: dict[str, dict] = {}
+            ret["structs"][struct_name] = {"doc": _extract_doc(lines, i - 1), "fields": fields}
 
             i += 1
 
             while not lines[i].startswith("));"):
                 line = lines[i].lstrip("\t").rstrip("\n")
-                if line.startswith("/") or line.startswith("*") or line.startswith(" ") or len(line) == 0:
+                if len(line) == 0 or line.startswith(_NON_FIELD_LINE_PREFIXES):
                     i += 1
                     continue
 
-                line = line.rsplit(";")[0]
                 doc = _extract_doc(lines, i - 1)
                 if line.startswith("union"):
                     # Union
@@ -3660,46 +3761,99 @@ def _parse_file(interface_lower: str, fp: str, r_file_lower2infos: dict[str, dic
                     i += 2
                     while not lines[i].lstrip("\t").startswith("}"):
                         line = lines[i].lstrip("\t").rstrip("\n")
-                        if line.startswith("/") or line.startswith("*") or line.startswith(" ") or len(line) == 0:
+                        if len(line) == 0 or line.startswith(_NON_FIELD_LINE_PREFIXES):
                             i += 1
                             continue
-                        line = line.rsplit(";")[0]
-                        splits = line.rsplit(" ", 1)
-                        if len(splits) != 2:
+                        m = _FIELD_RE.match(line)
+                        if m is None:
                             print(f"-ERROR: {fp}:{i}\n")
                             print(f"{lines[i]}")
                         else:
-                            union_fields[splits[1]] = splits[0]
+                            union_fields[m["name"]] = m["type"]
                         i += 1
 
-                    union_type = "Union{"
-                    for union_f in union_fields.keys():
-                        union_type += f"{union_fields[union_f]} : {union_f}, "
-                    union_type = union_type.rstrip(" ").rstrip(",") + "}"
+                    union_type = "Union{" + ", ".join(f"{union_f_type} : {union_f}" for union_f, union_f_type in union_fields.items()) + "}"
 
                     field = lines[i].lstrip("\t").lstrip("}").lstrip(" ").rstrip("\n").rstrip(";")
-                    r_file_lower2infos[interface_lower]["structs"][struct_name]["fields"][field] = {"doc": doc, "type": union_type}
+                    fields[field] = {"doc": doc, "type": union_type}
                 else:
                     # Regular
-                    splits = line.rsplit(" ", 1)
-                    if len(splits) != 2:
+                    m = _FIELD_RE.match(line)
+                    if m is None:
                         print(f"ERROR: {fp}:{i}\n")
                         print(f"{lines[i]}")
                     else:
-                        r_file_lower2infos[interface_lower]["structs"][struct_name]["fields"][splits[1]] = {"doc": doc, "type": splits[0]}
+                        fields[m["name"]] = {"doc": doc, "type": m["type"]}
 
                 i += 1
 
             if struct_name in ["EOS_AntiCheatCommon_Vec3f", "EOS_AntiCheatCommon_Quat"]:
                 #
-                r_file_lower2infos[interface_lower]["structs"].pop(struct_name)
+                ret["structs"].pop(struct_name)
 
             i += 1
             continue
 
-        else:
-            i += 1
-            continue
+        i += 1
+
+    return ret
+
+
+def _parse_interface_files(interface_lower: str, fps: list[str], need_interface_doc: bool) -> list[dict]:
+    # 按顺序解析同一接口的头文件，提取到接口说明后后续头文件不再扫描接口说明
+    ret: list[dict] = []
+    for fp in fps:
+        parsed = _parse_file_cached(interface_lower, fp, need_interface_doc)
+        need_interface_doc = need_interface_doc and len(parsed["interface_doc"]) <= 0
+        ret.append(parsed)
+    return ret
+
+
+def _parse_cache_file_and_key(fp: str, need_interface_doc: bool) -> tuple[str, tuple]:
+    # 以 (文件修改时间, 文件大小, 生成器自身修改时间, 是否扫描接口说明) 作为键缓存解析结果，SDK 与解析器均未变化时跳过解析
+    stat = os.stat(fp)
+    key = (stat.st_mtime_ns, stat.st_size, os.stat(__file__).st_mtime_ns, need_interface_doc)
+    # 缓存文件名包含完整路径的哈希，避免共用缓存目录的不同 SDK 目录下的同名头文件互相覆盖
+    path_hash = hashlib.md5(os.path.abspath(fp).encode("utf-8")).hexdigest()[:16]
+    return os.path.join(parse_cache_dir, f"{os.path.basename(fp)}.{path_hash}.pkl"), key
+
+
+def _load_parse_cache(fp: str, need_interface_doc: bool) -> Optional[dict]:
+    # 缓存未命中时返回 None
+    cache_file, key = _parse_cache_file_and_key(fp, need_interface_doc)
+    try:
+        with open(cache_file, "rb") as f:
+            cached_key, cached_infos = pickle.load(f)
+        if cached_key == key:
+            return cached_infos
+    except (OSError, EOFError, pickle.UnpicklingError, ValueError):
+        pass  # 无缓存或缓存已损坏，重新解析
+    return None
+
+
+def _parse_file_cached(interface_lower: str, fp: str, need_interface_doc: bool) -> dict:
+    infos = _load_parse_cache(fp, need_interface_doc)
+    if infos is not None:
+        return infos
+
+    infos = _parse_file(interface_lower, fp, need_interface_doc)
+
+    cache_file, key = _parse_cache_file_and_key(fp, need_interface_doc)
+    os.makedirs(parse_cache_dir, exist_ok=True)
+    with open(cache_file, "wb") as f:
+        pickle.dump((key, infos), f)
+    return infos
+
+
+def _merge_parsed_file_infos(r_infos: dict, parsed: dict) -> None:
+    # 类型名会被反复用作键进行查找与比较，驻留以便按引用比较（子进程的解析结果经反序列化后不再是驻留字符串）
+    for k in ["enums", "methods", "callbacks", "structs", "handles", "constants"]:
+        for name in parsed[k]:
+            r_infos[k][sys.intern(name)] = parsed[k][name]
+    # 接口说明以第一个提取到的为准
+    if len(r_infos["interface_doc"]) <= 0:
+        r_infos["interface_doc"] = parsed["interface_doc"]
+    api_latest_macros.update(sys.intern(macro) for macro in parsed["api_latest_macros"])
 
 
 def _extract_doc(lines: list[str], idx: int) -> list[str]:
@@ -3818,15 +3972,20 @@ def __is_int_str(text: str) -> bool:
         return False
 
 
+# 去除开头完整的 const 单词及其后的空格，再去除结尾的 "*"/"&" 及空格（如 "const char*" -> "char"，"constFoo" 保持不变）
+_DECAY_RE = re.compile(r"(?:const\b)? *(?P<type>.*?) *&*\**&*\**", re.S)
+
+
+@lru_cache(maxsize=None)
 def _decay_eos_type(t: str) -> str:
-    ret = t.lstrip("const").lstrip(" ").rstrip("*").rstrip("&").rstrip("*").rstrip("&").lstrip(" ").rstrip(" ")
-    return ret
+    return sys.intern(_DECAY_RE.fullmatch(t)["type"])
 
 
 def _is_client_data_field(type: str, field: str) -> bool:
     return type == "void*" and field == "ClientData"
 
 
+@lru_cache(maxsize=None)
 def _is_internal_struct_field(type: str, field: str) -> bool:
     decayed = _decay_eos_type(type)
     if decayed in ["EOS_AntiCheatCommon_Vec3f", "EOS_AntiCheatCommon_Quat"]:
@@ -3844,26 +4003,33 @@ def _is_variant_union_type(type: str, field: str) -> bool:
     return type.startswith("Union") and field != "AccountId"
 
 
+# 特殊处理的结构体数组字段, type: (field1, field2, ...)
+_STRUCT_ARR_FIELDS: dict[str, tuple[str, ...]] = {
+    "const EOS_Stats_IngestData*": ("Stats",),
+    "const EOS_PresenceModification_DataRecordId*": ("Records",),
+    "const EOS_Presence_DataRecord*": ("Records",),
+    "const EOS_Leaderboards_UserScoresQueryStatInfo*": ("StatInfo",),
+    "const EOS_Ecom_CheckoutEntry*": ("Entries",),
+    "const EOS_AntiCheatCommon_RegisterEventParamDef*": ("ParamDefs",),
+    "const EOS_AntiCheatCommon_LogEventParamPair*": ("Params",),
+    "const EOS_Achievements_StatThresholds*": ("StatThresholds",),
+    "const EOS_Achievements_PlayerStatInfo*": ("StatInfo",),
+}
+
+
 def _is_internal_struct_arr_field(type: str, field: str) -> bool:
-    # 特殊处理
-    struct_arr_map = {
-        "const EOS_Stats_IngestData*": ["Stats"],
-        "const EOS_PresenceModification_DataRecordId*": ["Records"],
-        "const EOS_Presence_DataRecord*": ["Records"],
-        "const EOS_Leaderboards_UserScoresQueryStatInfo*": ["StatInfo"],
-        "const EOS_Ecom_CheckoutEntry*": ["Entries"],
-        "const EOS_AntiCheatCommon_RegisterEventParamDef*": ["ParamDefs"],
-        "const EOS_AntiCheatCommon_LogEventParamPair*": ["Params"],
-        "const EOS_Achievements_StatThresholds*": ["StatThresholds"],
-        "const EOS_Achievements_PlayerStatInfo*": ["StatInfo"],
-    }
-    return type in struct_arr_map and field in struct_arr_map[type]
+    return type in _STRUCT_ARR_FIELDS and field in _STRUCT_ARR_FIELDS[type]
 
 
 def _is_requested_channel_ptr_field(type: str, field: str) -> bool:
     return type == "const uint8_t*" and field == "RequestedChannel"
 
 
+# 输出参数的名称前缀
+_OUT_ARG_PREFIXES: tuple[str, ...] = ("Out", "InOut", "bOut")
+
+
+@lru_cache(maxsize=None)
 def _is_arr_field(type: str, field_or_arg: str) -> bool:
     if _is_internal_struct_arr_field(type, field_or_arg):
         return False
@@ -3883,35 +4049,47 @@ def _is_arr_field(type: str, field_or_arg: str) -> bool:
             return False
     if _decay_eos_type(type) in ["EOS_AntiCheatCommon_Vec3f", "EOS_AntiCheatCommon_Quat"]:
         return False
-    if field_or_arg.startswith("Out") or field_or_arg.startswith("InOut") or field_or_arg.startswith("bOut"):
-        if type.endswith("**") or type.endswith("*"):
+    if field_or_arg.startswith(_OUT_ARG_PREFIXES):
+        if type.endswith("*"):
             return False  # 目前未发现有数组类型的Out参数
     return type.endswith("*")
 
 
+@lru_cache(maxsize=None)
 def _is_handle_type(type: str, field: str = "") -> bool:
     return type in handles or (type.startswith("EOS") and "_H" in type) or type in ["EOS_ContinuanceToken"]
 
 
-def _find_count_field(field: str, fields: list[str]) -> str:
-    splits = to_snake_case(field).split("_")
+# 数组长度字段的名称后缀
+_COUNT_FIELD_SUFFIXES: tuple[str, ...] = ("Count", "Size", "Length", "LengthBytes", "SizeBytes")
+
+
+@lru_cache(maxsize=None)
+def _count_field_candidates(field_names: tuple[str, ...]) -> tuple[tuple[str, tuple[str, ...]], ...]:
+    # 结构体中可能作为计数的字段，及其蛇形命名的前两段（已去除复数后缀，用于与数组字段比较）
+    return tuple(
+        (f, tuple(part.removesuffix("s").removesuffix("y") for part in to_snake_case(f).split("_")[:2]))
+        for f in field_names
+        if f.endswith(_COUNT_FIELD_SUFFIXES)
+    )
+
+
+def _find_count_field(field: str, fields: dict[str, str]) -> str:
+    splits = [part.removesuffix("ies").removesuffix("s") for part in to_snake_case(field).split("_")[:2]]
     similar_fields: list[str] = []
-    for f in fields:
-        if f == fields:
-            continue
-        if f.endswith("Count") or f.endswith("Size") or f.endswith("Length") or f.endswith("LengthBytes") or f.endswith("SizeBytes"):
-            f_splits = to_snake_case(f).split("_")
-            similar = 0
-            for i in range(min(2, len(f_splits), len(splits))):
-                if f_splits[i].removesuffix("s").removesuffix("y") == splits[i].removesuffix("ies").removesuffix("s"):
-                    similar += 1
-                else:
-                    break
-            if similar >= min(2, len(f_splits), len(splits)):
-                return f
+    for f, f_splits in _count_field_candidates(tuple(fields)):
+        compare_count = min(len(f_splits), len(splits))
+        similar = 0
+        for i in range(compare_count):
+            if f_splits[i] == splits[i]:
+                similar += 1
             else:
-                if similar > 0:
-                    similar_fields.append(f)
+                break
+        if similar >= compare_count:
+            return f
+        else:
+            if similar > 0:
+                similar_fields.append(f)
     if len(similar_fields) == 1:
         return similar_fields[0]
 
@@ -3943,9 +4121,11 @@ def _is_integrated_platform_init_option(type: str, field: str) -> bool:
     return type == "const void*" and field == "InitOptions"
 
 
+_NULLABLE_FLOAT_POINTER_FIELDS: dict[str, tuple[str, ...]] = {"double*": ("TaskNetworkTimeoutSeconds",)}
+
+
 def _is_nullable_float_pointer_field(type: str, field: str) -> bool:
-    map = {"double*": ["TaskNetworkTimeoutSeconds"]}
-    return type in map and field in map[type]
+    return type in _NULLABLE_FLOAT_POINTER_FIELDS and field in _NULLABLE_FLOAT_POINTER_FIELDS[type]
 
 
 def _is_struct_ptr(type: str) -> bool:
@@ -3967,9 +4147,11 @@ def _is_socket_id_type(type: str, name: str) -> bool:
     return type == "EOS_P2P_SocketId"
 
 
+_AUDIO_FRAMES_FIELDS: dict[str, tuple[str, ...]] = {"int16_t*": ("Frames",)}
+
+
 def _is_audio_frames_type(type: str, field: str) -> bool:
-    map = {"int16_t*": ["Frames"]}
-    return type in map and field in map[type]
+    return type in _AUDIO_FRAMES_FIELDS and field in _AUDIO_FRAMES_FIELDS[type]
 
 
 def _is_local_user_id(field: str) -> bool:
@@ -3992,13 +4174,14 @@ def _get_gd_type_of_local_user_id(field: str, eos_type: str) -> str:
 
 
 def _is_enum_flags_type(type: str) -> bool:
-    return _is_enum_type(type) and (type.endswith("Flags") or type.endswith("Combination"))
+    return _is_enum_type(type) and type.endswith(("Flags", "Combination"))
 
 
-def __find_count_and_variant_type_fields_in_struct(struct_type: bool) -> list[str]:
+@lru_cache(maxsize=None)
+def __find_count_and_variant_type_fields_in_struct(struct_type: str) -> frozenset[str]:
     ret: list[str] = []
     fields: dict[str, dict[str, str]] = structs[struct_type]["fields"]
-    for field in fields.keys():
+    for field in fields:
         if is_deprecated_field(field):
             ret.append(field)
             continue
@@ -4006,15 +4189,55 @@ def __find_count_and_variant_type_fields_in_struct(struct_type: bool) -> list[st
         field_type = fields[field]["type"]
         # 检出count字段，Godot不需要及将其作为成员
         if _is_arr_field(field_type, field) or _is_internal_struct_arr_field(field_type, field):
-            ret.append(_find_count_field(field, fields.keys()))
+            ret.append(_find_count_field(field, fields))
 
         # 检出Variant式的联合体类型字段，Godot不需要及将其作为成员
         elif _is_variant_union_type(field_type, field):
-            for f in fields.keys():
+            for f in fields:
                 if f == field + "Type":
                     ret.append(f)
                     break
 
+    return frozenset(ret)
+
+
+@lru_cache(maxsize=None)
+def _plan_struct(struct_type: str) -> dict[str, tuple[str, str]]:
+    # 回调展开结构体时的字段分类结果：字段名 -> (字段类别, 数量字段)，不需要成为参数的字段不包含在内，仅在解析完成后调用
+    ret: dict[str, tuple[str, str]] = {}
+    fields: dict[str, dict[str, str]] = __get_struct_fields(struct_type)
+    count_and_variant_type_fields: frozenset[str] = __find_count_and_variant_type_fields_in_struct(struct_type)
+    for field in fields:
+        field_type: str = fields[field]["type"]
+        if __is_api_version_field(field_type, field) or is_deprecated_field(field) or field in count_and_variant_type_fields:
+            continue
+        if _is_client_data_field(field_type, field):
+            # 接口与回调不再含有 ClientData
+            continue
+
+        decayed_type: str = _decay_eos_type(field_type)
+        if _is_enum_type(field_type):
+            ret[field] = ("enum_flags" if _is_enum_flags_type(field_type) else "enum", "")
+        elif _is_pure_handle_type(decayed_type):
+            ret[field] = ("pure_handle", "")
+        elif _is_socket_id_type(decayed_type, field):
+            ret[field] = ("socket_id", "")
+        elif _is_requested_channel_ptr_field(field_type, field):
+            ret[field] = ("requested_channel", "")
+        elif field_type.startswith("Union"):
+            ret[field] = ("union", "")
+        elif _is_internal_struct_arr_field(field_type, field):
+            ret[field] = ("struct_arr", _find_count_field(field, fields))
+        elif _is_internal_struct_field(field_type, field):
+            ret[field] = ("struct", "")
+        elif _is_handle_arr_type(field_type, field):
+            ret[field] = ("handle_arr", _find_count_field(field, fields))
+        elif _is_handle_type(decayed_type, field):
+            ret[field] = ("handle", "")
+        elif _is_arr_field(field_type, field):
+            ret[field] = ("arr", _find_count_field(field, fields))
+        else:
+            ret[field] = ("value", "")
     return ret
 
 
@@ -4030,38 +4253,29 @@ def _gen_struct_v2(
     bind_lines: list[str] = []
 
     #
-    count_and_variant_type_fields: list[str] = __find_count_and_variant_type_fields_in_struct(struct_type)
+    count_and_variant_type_fields: frozenset[str] = __find_count_and_variant_type_fields_in_struct(struct_type)
+
+    # 单次遍历筛选各生成段都需要跳过的字段（弃用、计数/变体类型、暂未实现），
+    # 并预先计算各段复用的 (字段, 类型, 退化类型, 蛇形命名)
+    emit_fields: list[tuple[str, str, str, str]] = []
+    for field in fields:
+        field_type: str = fields[field]["type"]
+        if is_deprecated_field(field) or field in count_and_variant_type_fields or _is_todo_field(field_type, field):
+            continue
+        emit_fields.append((field, field_type, _decay_eos_type(field_type), to_snake_case(field)))
 
     additional_methods_requirements = struct2additional_method_requirements[struct_type]
+    need_to: bool = additional_methods_requirements["to"]
+    need_from: bool = additional_methods_requirements["from"]
+    need_set_to: bool = additional_methods_requirements["set_to"]
+    need_set_from: bool = additional_methods_requirements["set_from"]
 
     typename = __convert_to_struct_class(struct_type)
 
     #
-    for field in fields.keys():
-        type: str = fields[field]["type"]
-        snake_field_name: str = to_snake_case(field)
-        decayed_type: str = _decay_eos_type(type)
-        remapped_type: str = ""
-
-        if not _is_need_skip_struct(decayed_type) and __is_struct_type(decayed_type) and not _is_internal_struct_arr_field(type, field):
-            # 非数组的结构体
-            remapped_type = remap_type(decayed_type, field)
-        elif _is_nullable_float_pointer_field(type, field):
-            remapped_type = _decay_eos_type(type)
-        elif _is_handle_type(decayed_type):
-            # 句柄类型使用Ref<RefCounted>作为成员变量，非 msvc 编译器不支持Ref<T>作为成员时T的前向声明
-            remapped_type = "Ref<RefCounted>"
-        else:
-            remapped_type = remap_type(type, field)
-
-        if is_deprecated_field(field):
-            continue
-        elif field in count_and_variant_type_fields:
-            continue
-        elif _is_memory_func_type(type):
+    for field, type, decayed_type, snake_field_name in emit_fields:
+        if _is_memory_func_type(type):
             continue  # 内存分配方法不需要成员变量
-        elif _is_todo_field(type, field):
-            continue
         elif _is_platform_specific_options_field(field):
             continue
         elif _is_system_initialize_options_filed(field, type):
@@ -4080,7 +4294,21 @@ def _gen_struct_v2(
                     f"Ref<{_convert_handle_class_name(type)}> {__convert_to_struct_class(struct_type)}::get_local_user_id() const {{ return eos::{_get_gd_type_of_local_user_id(field, type)}::get_local(); }}"
                 )
             continue  # 假定只有一个本地用户时不生产该字段
-        elif remapped_type == "bool":
+
+        # 仅为需要生成的字段映射类型
+        remapped_type: str = ""
+        if not _is_need_skip_struct(decayed_type) and __is_struct_type(decayed_type) and not _is_internal_struct_arr_field(type, field):
+            # 非数组的结构体
+            remapped_type = remap_type(decayed_type, field)
+        elif _is_nullable_float_pointer_field(type, field):
+            remapped_type = decayed_type
+        elif _is_handle_type(decayed_type):
+            # 句柄类型使用Ref<RefCounted>作为成员变量，非 msvc 编译器不支持Ref<T>作为成员时T的前向声明
+            remapped_type = "Ref<RefCounted>"
+        else:
+            remapped_type = remap_type(type, field)
+
+        if remapped_type == "bool":
             bind_lines.append(f"\t_BIND_PROP_BOOL({snake_field_name})")
             member_lines.append(f"\tbool {snake_field_name}{{}};")
             setget_declare_lines.append(f"\t_DECLARE_SETGET_BOOL({snake_field_name})")
@@ -4088,7 +4316,7 @@ def _gen_struct_v2(
         elif _is_socket_id_type(decayed_type, field):
             bind_lines.append(f"\t_BIND_PROP_STR({snake_field_name})")
             setget_declare_lines.append(f"\t_DECLARE_SETGET_STR({snake_field_name})")
-            if additional_methods_requirements["set_to"]:
+            if need_set_to:
                 member_lines.append(f"\tEOS_P2P_SocketId {snake_field_name};")
                 setget_define_lines.append(f"_DEFINE_SETGET_STR_SOCKET_ID({typename}, {snake_field_name})")
             else:
@@ -4103,11 +4331,11 @@ def _gen_struct_v2(
             else:
                 setget_define_lines.append(f"_DEFINE_SETGET_STR_SOCKET_NAME({typename}, {snake_field_name})")
         elif _is_str_arr_type(type, field):
-            bind_lines.append(f"\t_BIND_PROP_STR_ARR({to_snake_case(field)})")
+            bind_lines.append(f"\t_BIND_PROP_STR_ARR({snake_field_name})")
             member_lines.append(f"\tLocalVector<CharString> {snake_field_name};")
             setget_declare_lines.append(f"\t_DECLARE_SETGET_STR_ARR({snake_field_name})")
             setget_define_lines.append(f"_DEFINE_SETGET_STR_ARR({typename}, {snake_field_name})")
-            if additional_methods_requirements["to"]:
+            if need_to:
                 # 需要转为eos类型的结构体数组才需要的字段
                 element_type: str = __get_str_arr_element_type(type)
                 if element_type != "const char*":  # 如果是C字符串则直接使用CharString
@@ -4117,7 +4345,7 @@ def _gen_struct_v2(
             setget_declare_lines.append(f"\t_DECLARE_SETGET({snake_field_name})")
             setget_define_lines.append(f"_DEFINE_SETGET({typename}, {snake_field_name})")
             member_lines.append(f"\tTypedArray<class {_convert_handle_class_name(decayed_type)}> {snake_field_name};")
-            if additional_methods_requirements["to"]:
+            if need_to:
                 # 需要转为eos类型的结构体数组才需要的字段
                 member_lines.append(f"\tLocalVector<{_decay_eos_type(type)}> _shadow_{snake_field_name}{{}};")
         elif _is_handle_type(decayed_type):
@@ -4135,7 +4363,7 @@ def _gen_struct_v2(
             setget_declare_lines.append(f"\t_DECLARE_SETGET({snake_field_name})")
             setget_define_lines.append(f"_DEFINE_SETGET({typename}, {snake_field_name})")
             member_lines.append(f"\t{remapped_type} {snake_field_name}{{}};")
-            if additional_methods_requirements["to"]:
+            if need_to:
                 # 需要转为eos类型的结构体数组才需要的字段
                 member_lines.append(f"\tLocalVector<{_decay_eos_type(type)}> _shadow_{snake_field_name}{{}};")
         elif __is_struct_type(decayed_type):
@@ -4216,20 +4444,20 @@ def _gen_struct_v2(
     lines.append(f"\tGDCLASS({typename}, EOSDataClass)")
     lines.append("")
     lines += member_lines
-    if additional_methods_requirements["to"]:
+    if need_to:
         lines.append("")
         lines.append(f"\t{struct_type} m_eos_data{{}};")
     lines.append("")
     lines.append("public:")
     lines += setget_declare_lines
     lines.append("")
-    if additional_methods_requirements["set_from"]:
+    if need_set_from:
         lines.append(f"\tvoid set_from_eos(const {struct_type} &p_origin);")
-    if additional_methods_requirements["from"]:
+    if need_from:
         lines.append(f"\tstatic Ref<{typename}> from_eos(const {struct_type} &p_origin);")
-    if additional_methods_requirements["set_to"]:
+    if need_set_to:
         lines.append(f"\tvoid set_to_eos({struct_type} &p_origin);")
-    if additional_methods_requirements["to"]:
+    if need_to:
         lines.append(f"\t{struct_type} &to_eos() {{set_to_eos(m_eos_data); return m_eos_data;}}")
     lines.append("")
     lines.append(f"\tString _to_string() const;")
@@ -4249,7 +4477,7 @@ def _gen_struct_v2(
 
     optional_cpp_lines: list[str] = []
 
-    if additional_methods_requirements["from"]:
+    if need_from:
         r_structs_cpp.append(f"Ref<{typename}> {typename}::from_eos(const {struct_type} &p_origin) {{")
         r_structs_cpp.append(f"\tRef<{typename}> ret;")
         r_structs_cpp.append(f"\tret.instantiate();")
@@ -4257,18 +4485,9 @@ def _gen_struct_v2(
         r_structs_cpp.append(f"\treturn ret;")
         r_structs_cpp.append("}")
 
-    if additional_methods_requirements["set_from"]:
+    if need_set_from:
         r_structs_cpp.append(f"void {typename}::set_from_eos(const {struct_type} &p_origin) {{")
-        for field in fields.keys():
-            field_type = fields[field]["type"]
-            snake_case_field = to_snake_case(field)
-
-            if is_deprecated_field(field):
-                continue
-            if field in count_and_variant_type_fields:
-                continue
-            if _is_todo_field(field_type, field):
-                continue
+        for field, field_type, decayed_type, snake_case_field in emit_fields:
             if __is_api_version_field(field_type, field):
                 continue
             if _is_client_data_field(field_type, field):
@@ -4296,8 +4515,8 @@ def _gen_struct_v2(
                     r_structs_cpp.append(
                         f'\tif(!{_get_gd_type_of_local_user_id(field, field_type)}::_is_valid_local_id(p_origin.{field})) {{ ERR_PRINT("The local user id in output struct is not compatible with existing local user!!"); }}'
                     )
-            elif _is_socket_id_type(_decay_eos_type(field_type), field):
-                if additional_methods_requirements["set_to"]:
+            elif _is_socket_id_type(decayed_type, field):
+                if need_set_to:
                     r_structs_cpp.append(f"\tmemcpy(&{snake_case_field}.SocketName[0], &p_origin.{field}.SocketName[0], EOS_P2P_SOCKETID_SOCKETNAME_SIZE);")
                 else:
                     r_structs_cpp.append(f"\t{snake_case_field}.resize(EOS_P2P_SOCKETID_SOCKETNAME_SIZE);")
@@ -4309,8 +4528,8 @@ def _gen_struct_v2(
                 else:
                     r_structs_cpp.append(f"\t{snake_case_field} = to_godot_type<{field_type}, CharString>(p_origin.{field});")
             elif _is_str_arr_type(field_type, field):
-                r_structs_cpp.append(f"\t_FROM_EOS_STR_ARR({snake_case_field}, p_origin.{field}, p_origin.{_find_count_field(field, fields.keys())});")
-            elif _is_pure_handle_type(_decay_eos_type(field_type)):
+                r_structs_cpp.append(f"\t_FROM_EOS_STR_ARR({snake_case_field}, p_origin.{field}, p_origin.{_find_count_field(field, fields)});")
+            elif _is_pure_handle_type(decayed_type):
                 r_structs_cpp.append(f"\t_FROM_EOS_FIELD_PURE_HANDLE({snake_case_field}, p_origin.{field});")
             elif _is_requested_channel_ptr_field(field_type, field):
                 r_structs_cpp.append(f"\t_FROM_EOS_FIELD_REQUESTED_CHANNEL({snake_case_field}, p_origin.{field});")
@@ -4321,43 +4540,33 @@ def _gen_struct_v2(
                     r_structs_cpp.append(f"\t_FROM_EOS_FIELD_METRICS_ACCOUNT_ID_UNION({snake_case_field}, p_origin.{field});")
             elif _is_handle_arr_type(field_type, ""):
                 r_structs_cpp.append(
-                    f"\t_FROM_EOS_FIELD_HANDLER_ARR({snake_case_field}, {_convert_handle_class_name(_decay_eos_type(field_type))}, p_origin.{field}, p_origin.{_find_count_field(field, fields.keys())});"
+                    f"\t_FROM_EOS_FIELD_HANDLER_ARR({snake_case_field}, {_convert_handle_class_name(decayed_type)}, p_origin.{field}, p_origin.{_find_count_field(field, fields)});"
                 )
-            elif _is_handle_type(_decay_eos_type(field_type), field):
-                r_structs_cpp.append(f"\t_FROM_EOS_FIELD_HANDLER({snake_case_field}, {_convert_handle_class_name(_decay_eos_type(field_type))}, p_origin.{field});")
+            elif _is_handle_type(decayed_type, field):
+                r_structs_cpp.append(f"\t_FROM_EOS_FIELD_HANDLER({snake_case_field}, {_convert_handle_class_name(decayed_type)}, p_origin.{field});")
             elif _is_internal_struct_arr_field(field_type, field):
                 r_structs_cpp.append(
-                    f"\t_FROM_EOS_FIELD_STRUCT_ARR({__convert_to_struct_class(field_type)}, {snake_case_field}, p_origin.{field}, p_origin.{_find_count_field(field, fields.keys())});"
+                    f"\t_FROM_EOS_FIELD_STRUCT_ARR({__convert_to_struct_class(field_type)}, {snake_case_field}, p_origin.{field}, p_origin.{_find_count_field(field, fields)});"
                 )
             elif _is_internal_struct_field(field_type, field):
                 r_structs_cpp.append(f"\t_FROM_EOS_FIELD_STRUCT({snake_case_field}, p_origin.{field});")
             elif _is_arr_field(field_type, field):
-                r_structs_cpp.append(f"\t_FROM_EOS_FIELD_ARR({snake_case_field}, p_origin.{field}, p_origin.{_find_count_field(field, fields.keys())});")
+                r_structs_cpp.append(f"\t_FROM_EOS_FIELD_ARR({snake_case_field}, p_origin.{field}, p_origin.{_find_count_field(field, fields)});")
             elif _is_enum_flags_type(field_type):
                 r_structs_cpp.append(f"\t_FROM_EOS_FIELD_FLAGS({snake_case_field}, p_origin.{field.split('[')[0]});")
             else:
                 r_structs_cpp.append(f"\t_FROM_EOS_FIELD({snake_case_field}, p_origin.{field.split('[')[0]});")
         r_structs_cpp.append("}")
 
-    if additional_methods_requirements["set_to"]:
+    if need_set_to:
         r_structs_cpp.append(f"void {typename}::set_to_eos({struct_type} &p_data) {{")
         # r_structs_cpp.append(f"\tmemset(&p_data, 0, sizeof(p_data));")
 
-        for field in fields.keys():
-            field_type = fields[field]["type"]
-            snake_field_name = to_snake_case(field)
-
+        for field, field_type, decayed_type, snake_field_name in emit_fields:
             # if field == "Reserved" and field_type == "void*":
             #     # TODO：考虑使用memset直接将整个结构体清零避免对预留字段的特殊处理
             #     r_structs_cpp.append(f"\tp_data.Reserved = nullptr;")
 
-            if is_deprecated_field(field):
-                continue
-            if field in count_and_variant_type_fields:
-                continue
-            if _is_todo_field(field_type, field):
-                continue
-
             if field_type == "EOS_AllocateMemoryFunc":
                 r_structs_cpp.append(f"\tp_data.AllocateMemoryFunction = &internal::_memallocate;")
             elif field_type == "EOS_ReallocateMemoryFunc":
@@ -4367,7 +4576,7 @@ def _gen_struct_v2(
             else:
                 if assume_only_one_local_user and _is_local_user_id(field) and _need_ignore_local_user_id_struct(struct_type=struct_type):
                     # 假定只有一个本地用户时不生成该字段,从静态变量中查找
-                    interface_class = _get_login_interface_of_local_user_id(field, type)
+                    interface_class = _get_login_interface_of_local_user_id(field, field_type)
                     if _need_check_null_local_user_id_struct(struct_type):
                         r_structs_cpp.append(
                             f'\tif({_get_gd_type_of_local_user_id(field, field_type)}::_get_local_native() == nullptr) {{ ERR_PRINT("Setup \\"{typename}\\" failed: has not local user, please login by using \\"{interface_class}.login()\\" first."); }}'
@@ -4378,10 +4587,10 @@ def _gen_struct_v2(
                 elif _is_audio_frames_type(field_type, field):
                     r_structs_cpp.append(f"\t_packed_int32_to_audio_frames({snake_field_name}, _shadow_{snake_field_name});")
                     r_structs_cpp.append(f"\tp_data.{field} = _shadow_{snake_field_name}.ptr();")
-                    r_structs_cpp.append(f"\tp_data.{_find_count_field(field, fields.keys())} = _shadow_{snake_field_name}.size();")
+                    r_structs_cpp.append(f"\tp_data.{_find_count_field(field, fields)} = _shadow_{snake_field_name}.size();")
                 elif _is_struct_ptr(field_type):
                     r_structs_cpp.append(f"\tp_data.{field} = &{snake_field_name};")
-                elif _is_socket_id_type(_decay_eos_type(field_type), field):
+                elif _is_socket_id_type(decayed_type, field):
                     r_structs_cpp.append(f"\t{snake_field_name}.ApiVersion = EOS_P2P_SOCKETID_API_LATEST;")
                     r_structs_cpp.append(f"\tp_data.{field} = &{snake_field_name};")
                 elif _is_reserved_field(field, field_type):
@@ -4393,7 +4602,7 @@ def _gen_struct_v2(
                     else:
                         r_structs_cpp.append(f"\tp_data.{field} = to_eos_type<const CharString &, {field_type}>({snake_field_name});")
                 elif _is_str_arr_type(field_type, field):
-                    count_filed: str = _find_count_field(field, fields.keys())
+                    count_filed: str = _find_count_field(field, fields)
                     if __get_str_arr_element_type(field_type) == "const char*":
                         # C字符串数组直接使用LocalVector<CharString>的指针
                         r_structs_cpp.append(f"\tp_data.{field} = (decltype(p_data.{field})){snake_field_name}.ptr();")
@@ -4406,7 +4615,7 @@ def _gen_struct_v2(
                     r_structs_cpp.append(f"\tp_data.{field} = get_platform_specific_options();")
                 elif _is_system_initialize_options_filed(field, field_type):
                     r_structs_cpp.append(f"\tp_data.{field} = get_system_initialize_options();")
-                elif _is_pure_handle_type(_decay_eos_type(field_type)):
+                elif _is_pure_handle_type(decayed_type):
                     r_structs_cpp.append(f"\t_TO_EOS_FIELD_PURE_HANDLE(p_data.{field}, {snake_field_name});")
                 elif _is_requested_channel_ptr_field(field_type, field):
                     r_structs_cpp.append(f"\t_TO_EOS_FIELD_REQUESTED_CHANNEL(p_data.{field}, {snake_field_name});")
@@ -4417,10 +4626,10 @@ def _gen_struct_v2(
                         r_structs_cpp.append(f"\t_TO_EOS_FIELD_METRICS_ACCOUNT_ID_UNION(p_data.{field}, {snake_field_name});")
                 elif _is_handle_arr_type(field_type, ""):
                     r_structs_cpp.append(
-                        f"\t_TO_EOS_FIELD_HANDLER_ARR(p_data.{field}, {snake_field_name}, _shadow_{snake_field_name}, p_data.{_find_count_field(field, fields.keys())});"
+                        f"\t_TO_EOS_FIELD_HANDLER_ARR(p_data.{field}, {snake_field_name}, _shadow_{snake_field_name}, p_data.{_find_count_field(field, fields)});"
                     )
-                elif _is_handle_type(_decay_eos_type(field_type), field):
-                    gd_type = _convert_handle_class_name(_decay_eos_type(field_type))
+                elif _is_handle_type(decayed_type, field):
+                    gd_type = _convert_handle_class_name(decayed_type)
                     r_structs_cpp.append(f"\t_TO_EOS_FIELD_HANDLER(p_data.{field}, {snake_field_name}, {gd_type});")
                 elif _is_client_data_field(field_type, field):
                     # 没有需要设置ClientData的结构体
@@ -4428,19 +4637,19 @@ def _gen_struct_v2(
                     _print_stack_and_exit()
                 elif _is_internal_struct_arr_field(field_type, field):
                     r_structs_cpp.append(
-                        f"\t_TO_EOS_FIELD_STRUCT_ARR(p_data.{field}, {snake_field_name}, _shadow_{snake_field_name}, p_data.{_find_count_field(field, fields.keys())});"
+                        f"\t_TO_EOS_FIELD_STRUCT_ARR(p_data.{field}, {snake_field_name}, _shadow_{snake_field_name}, p_data.{_find_count_field(field, fields)});"
                     )
                 elif _is_internal_struct_field(field_type, field) or _is_integrated_platform_init_option(field_type, field):
                     r_structs_cpp.append(f"\t_TO_EOS_FIELD_STRUCT(p_data.{field}, {snake_field_name});")
                 elif _is_arr_field(field_type, field):
-                    r_structs_cpp.append(f"\t_TO_EOS_FIELD_ARR(p_data.{field}, {snake_field_name}, p_data.{_find_count_field(field, fields.keys())});")
+                    r_structs_cpp.append(f"\t_TO_EOS_FIELD_ARR(p_data.{field}, {snake_field_name}, p_data.{_find_count_field(field, fields)});")
                 elif _is_enum_flags_type(field_type):
                     r_structs_cpp.append(f"\t_TO_EOS_FIELD_FLAGS(p_data.{field}, {snake_field_name});")
-                elif __is_callback_type(_decay_eos_type(field_type)):
-                    cb_arg = _get_callback_infos(_decay_eos_type(field_type))["args"][0]
+                elif __is_callback_type(decayed_type):
+                    cb_arg = _get_callback_infos(decayed_type)["args"][0]
                     eos_cb_type = _decay_eos_type(cb_arg["type"])
                     gd_cb_type = remap_type(eos_cb_type).removeprefix("Ref<").removesuffix(">")
-                    signal_name = __convert_to_signal_name(_decay_eos_type(field_type), "")
+                    signal_name = __convert_to_signal_name(decayed_type, "")
 
                     const_str_line: str = f'constexpr char {signal_name}[] = "{signal_name}";'
                     if not const_str_line in optional_cpp_lines and not const_str_line in r_structs_cpp:
@@ -4490,7 +4699,7 @@ def _gen_struct_v2(
                         _print_stack_and_exit()
                     r_structs_cpp.append("#endif")
                 else:
-                    r_structs_cpp.append(f"\t_TO_EOS_FIELD(p_data.{field.split('[')[0]}, {to_snake_case(field)});")
+                    r_structs_cpp.append(f"\t_TO_EOS_FIELD(p_data.{field.split('[')[0]}, {snake_field_name});")
 
         r_structs_cpp.append("}")
 
@@ -4575,7 +4784,7 @@ def __make_callback_doc(callback_type: str) -> list[str]:
         else:
             arg_fields = __get_struct_fields(decayed_type)
 
-            count_and_variant_type_fields: list[str] = __find_count_and_variant_type_fields_in_struct(decayed_type)
+            count_and_variant_type_fields: frozenset[str] = __find_count_and_variant_type_fields_in_struct(decayed_type)
             for f in arg_fields:
                 # 处理要跳过的字段
                 if f in count_and_variant_type_fields:
@@ -4955,23 +5164,45 @@ def __insert_doc_to(typename: str, lines: list[str], insert_idx: int, doc: list[
 
 def __get_doc_file(typename: str) -> list[str]:
     try:
-        f = open(os.path.join("./doc_classes", typename) + ".xml", "r", encoding="utf-8")
-        ret: list[str] = f.readlines()
-        f.close()
-        return ret
+        with open(os.path.join("./doc_classes", typename) + ".xml", "r", encoding="utf-8") as f:
+            return f.readlines()
     except:
         return []
 
 
 def __store_doc_file(typename: str, content: list[str]):
     try:
-        f = open(os.path.join("./doc_classes", typename) + ".xml", "w", encoding="utf-8")
-        f.writelines(content)
-        f.close()
+        with open(os.path.join("./doc_classes", typename) + ".xml", "w", encoding="utf-8") as f:
+            f.writelines(content)
     except:
         return
 
 
+def _write_lines(file_path: str, lines: Union[list[str], deque[str]]) -> None:
+    # 拼接为整个文件内容后一次写入
+    # 内容未变化时不写入，保持文件修改时间不变以免触发重新编译
+    if _is_same_as_file_content(file_path, lines):
+        return
+    with open(file_path, "w", buffering=1 << 20) as f:
+        f.write("\n".join(lines))
+
+
+def _is_same_as_file_content(file_path: str, lines: Union[list[str], deque[str]]) -> bool:
+    # 逐行从文件中读取等长内容进行比较，与 _write_lines 的写入内容一致，遇到不同立即返回
+    try:
+        with open(file_path, "r", buffering=1 << 17) as f:
+            is_first_line: bool = True
+            for line in lines:
+                if not is_first_line and f.read(1) != "\n":
+                    return False
+                if f.read(len(line)) != line:
+                    return False
+                is_first_line = False
+            return len(f.read(1)) == 0
+    except (OSError, UnicodeDecodeError):
+        return False
+
+
 def _print_stack_and_exit():
     for l in traceback.format_stack():
         print(l)